@@ -0,0 +1,88 @@
+"""
+API Authentication Backends
+PyService Mini-ITSM Platform
+
+JWT and session authentication with short-lived verification caches.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.authentication import SessionAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+# Upper bound on how long a verified token is trusted without re-checking
+JWT_AUTH_CACHE_TIMEOUT = 5
+SESSION_AUTH_CACHE_TIMEOUT = 5
+
+
+def session_auth_cache_key(session_key):
+    """Build the cache key for an authenticated session."""
+    return 'session_auth:' + hashlib.sha256(session_key.encode()).hexdigest()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that caches verified tokens for a few seconds.
+
+    Clients typically fire bursts of API calls with the same access token;
+    caching the (user, token) pair by the token's SHA-256 skips the signature
+    check and the user lookup for every call in the burst. Entries never
+    outlive the token's own expiry.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        cache_key = 'jwt:' + hashlib.sha256(raw_token).hexdigest()
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # Already verified: rebuild the token object without re-checking
+            # the signature (token objects can hold unpicklable key objects)
+            user, token_class = cached
+            return user, token_class(raw_token, verify=False)
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+
+        timeout = min(int(validated_token['exp'] - time.time()), JWT_AUTH_CACHE_TIMEOUT)
+        if timeout > 0:
+            cache.set(cache_key, (user, type(validated_token)), timeout)
+
+        return user, validated_token
+
+
+class CachedSessionAuthentication(SessionAuthentication):
+    """
+    SessionAuthentication that caches the session's user for a few seconds.
+
+    Resolving request.user loads the session row and then the user row;
+    for bursts of API calls from the browser the resolved user is reused
+    instead. CSRF is still enforced on every request, and the entry is
+    dropped on logout (see api.signals).
+    """
+
+    def authenticate(self, request):
+        session_key = request._request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        if not session_key:
+            return super().authenticate(request)
+
+        cache_key = session_auth_cache_key(session_key)
+        user = cache.get(cache_key)
+        if user is not None:
+            self.enforce_csrf(request)
+            return user, None
+
+        result = super().authenticate(request)
+        if result is not None:
+            cache.set(cache_key, result[0], SESSION_AUTH_CACHE_TIMEOUT)
+        return result
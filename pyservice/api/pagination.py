@@ -0,0 +1,18 @@
+"""
+API Pagination
+PyService Mini-ITSM Platform
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the primary key, newest first.
+
+    Each page is a `WHERE id < <cursor> LIMIT n` seek, so deep pages cost
+    the same as the first one (OFFSET pagination re-scans every skipped
+    row). Views that need page-number jumps can set `pagination_class`
+    to PageNumberPagination.
+    """
+    ordering = '-id'
@@ -0,0 +1,67 @@
+"""
+API Renderers
+PyService Mini-ITSM Platform
+"""
+
+import math
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def _has_non_finite(data):
+    """Whether any float nested in dicts/lists/tuples is NaN or infinite."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing equivalent documents through orjson.
+
+    Dicts, lists, strings and numbers are encoded in C; anything orjson
+    does not know (Decimal, lazy strings, querysets) and datetimes, which
+    DRF formats its own way, go through DRF's JSONEncoder. The bytes match
+    JSONRenderer's except for floats written with an exponent, which orjson
+    spells 1e16 / 1e-7 where the stdlib gives 1e+16 / 1e-07 (same values).
+
+    orjson only writes compact, unindented UTF-8, so indented responses
+    (the browsable API, "Accept: application/json; indent=4") and the
+    non-default UNICODE_JSON/COMPACT_JSON settings are left to
+    JSONRenderer, as are documents orjson would encode differently
+    (NaN/Infinity, integers beyond 64 bits).
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=JSONEncoder().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson writes NaN and Infinity as null where JSONRenderer raises
+        # (STRICT_JSON) or writes them out; only a document with a null in
+        # it can hold one, so only those are checked
+        if b'null' in ret and _has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028/U+2029 like JSONRenderer, so the output stays a
+        # strict JavaScript subset
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
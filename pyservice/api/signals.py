@@ -0,0 +1,18 @@
+"""
+API Signals
+PyService Mini-ITSM Platform
+"""
+
+from django.contrib.auth.signals import user_logged_out
+from django.core.cache import cache
+from django.dispatch import receiver
+
+from .authentication import session_auth_cache_key
+
+
+@receiver(user_logged_out)
+def drop_cached_session_auth(sender, request, user, **kwargs):
+    """Stop trusting the cached session user once the session logs out."""
+    session_key = request.session.session_key if request is not None else None
+    if session_key:
+        cache.delete(session_auth_cache_key(session_key))
@@ -186,6 +186,33 @@ class TestAuthentication:
         """Test accessing protected endpoint with authentication."""
         response = authenticated_client.get('/api/incidents/')
         assert response.status_code == status.HTTP_200_OK
+    
+    def test_bearer_token_reused_from_cache(self, api_client, user):
+        """Test repeated requests with the same access token."""
+        token_response = api_client.post('/api/auth/token/', {
+            'username': 'testuser',
+            'password': 'testpass123'
+        })
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token_response.data['access']}")
+        
+        assert api_client.get('/api/auth/profile/').data['username'] == 'testuser'
+        assert api_client.get('/api/auth/profile/').data['username'] == 'testuser'
+    
+    def test_invalid_bearer_token_rejected(self, api_client):
+        """Test that an invalid access token is not authenticated."""
+        api_client.credentials(HTTP_AUTHORIZATION='Bearer not-a-token')
+        response = api_client.get('/api/incidents/')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_session_auth_dropped_on_logout(self, api_client, user):
+        """Test that a cached session user is not trusted after logout."""
+        api_client.login(username='testuser', password='testpass123')
+        assert api_client.get('/api/auth/profile/').status_code == status.HTTP_200_OK
+        assert api_client.get('/api/auth/profile/').status_code == status.HTTP_200_OK
+
+        api_client.logout()
+        response = api_client.get('/api/auth/profile/')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
 # =============================================================================
@@ -201,7 +228,22 @@ class TestIncidentAPI:
         response = authenticated_client.get('/api/incidents/')
         assert response.status_code == status.HTTP_200_OK
         assert 'results' in response.data or isinstance(response.data, list)
-    
+
+    def test_list_incidents_cursor_pagination(self, authenticated_client, user):
+        """Test that incident listings are paged by cursor, newest first."""
+        for i in range(25):
+            Incident.objects.create(
+                title=f'Incident {i}', description='Test', caller=user, impact=3, urgency=3
+            )
+
+        first_page = authenticated_client.get('/api/incidents/')
+        assert len(first_page.data['results']) == 20
+        assert first_page.data['results'][0]['title'] == 'Incident 24'
+
+        second_page = authenticated_client.get(first_page.data['next'])
+        assert len(second_page.data['results']) == 5
+        assert second_page.data['next'] is None
+
     def test_create_incident(self, authenticated_client, user):
         """Test creating an incident."""
         data = {
@@ -418,3 +460,106 @@ class TestMetricsAPI:
         assert response.status_code == status.HTTP_200_OK
         assert 'incidents' in response.data
         assert 'assets' in response.data
+
+
+# =============================================================================
+# Throttling Tests
+# =============================================================================
+
+@pytest.mark.django_db
+class TestThrottling:
+    """Test the counter-based API throttles."""
+    
+    def test_user_throttle_limits_per_window(self, user):
+        """Test that requests over the rate are refused until the next window."""
+        from django.core.cache import caches
+        from rest_framework.test import APIRequestFactory
+        from rest_framework.request import Request
+        from api.throttling import UserCounterThrottle
+        
+        class TwoPerMinuteThrottle(UserCounterThrottle):
+            rate = '2/min'
+        
+        caches['throttling'].clear()
+        request = Request(APIRequestFactory().get('/api/incidents/'))
+        request.user = user
+        throttle = TwoPerMinuteThrottle()
+        throttle.timer = lambda: 120.0
+        
+        assert throttle.allow_request(request, None)
+        assert throttle.allow_request(request, None)
+        assert not throttle.allow_request(request, None)
+        assert throttle.wait() == 60
+        
+        throttle.timer = lambda: 180.0
+        assert throttle.allow_request(request, None)
+    
+    def test_redis_client_falls_back_off_redis(self):
+        """Test the raw Redis client helper yields nothing for other backends."""
+        from unittest import mock
+        from django.core.cache import caches
+        from django.core.cache.backends.redis import RedisCache
+        from core.cache import redis_client
+        
+        assert redis_client(caches['throttling'], 'key') == (None, None)
+        
+        # RedisCache internals moved by a Django upgrade
+        redis_cache = mock.Mock(spec=RedisCache)
+        redis_cache.make_and_validate_key.return_value = ':1:key'
+        del redis_cache._cache
+        assert redis_client(redis_cache, 'key') == (None, None)
+
+
+# =============================================================================
+# Renderer Tests
+# =============================================================================
+
+class TestORJSONRenderer:
+    """Test ORJSONRenderer output against DRF's JSONRenderer."""
+    
+    def test_matches_json_renderer(self):
+        """Test compact output is byte-for-byte what JSONRenderer gives (no exponent floats)."""
+        import datetime
+        import decimal
+        from rest_framework.renderers import JSONRenderer
+        from api.renderers import ORJSONRenderer
+        
+        data = {
+            'title': 'Printer\u2028offline\u2029 – 3. kat',
+            'created_at': datetime.datetime(2026, 10, 16, 9, 30, tzinfo=datetime.timezone.utc),
+            'cost': decimal.Decimal('12.50'),
+            'tags': ['network', None, 1.5, True],
+            1: 'numeric key',
+        }
+        expected = JSONRenderer().render(data)
+        assert ORJSONRenderer().render(data) == expected
+        assert b'\\u2028' in expected
+    
+    def test_indent_from_accept_header(self):
+        """Test indent=N in the Accept header is honoured."""
+        from rest_framework.renderers import JSONRenderer
+        from api.renderers import ORJSONRenderer
+        
+        data = {'a': [1, 2], 'b': {'c': 'd'}}
+        media_type = 'application/json; indent=4'
+        assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+        assert b'\n    "a"' in ORJSONRenderer().render(data, media_type)
+    
+    def test_non_finite_float_rejected(self):
+        """Test NaN and Infinity raise like JSONRenderer under STRICT_JSON."""
+        from api.renderers import ORJSONRenderer
+        
+        for value in (float('nan'), float('inf')):
+            with pytest.raises(ValueError):
+                ORJSONRenderer().render({'score': value})
+    
+    def test_exponent_floats_differ_only_in_spelling(self):
+        """Test exponent floats are the same numbers, spelt without + or zero padding."""
+        import json
+        from rest_framework.renderers import JSONRenderer
+        from api.renderers import ORJSONRenderer
+        
+        data = {'big': 1e16, 'small': 1e-7}
+        assert JSONRenderer().render(data) == b'{"big":1e+16,"small":1e-07}'
+        assert ORJSONRenderer().render(data) == b'{"big":1e16,"small":1e-7}'
+        assert json.loads(ORJSONRenderer().render(data)) == data
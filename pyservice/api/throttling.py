@@ -0,0 +1,67 @@
+"""
+API Throttling
+PyService Mini-ITSM Platform
+
+Fixed-window rate limits backed by an atomic cache counter.
+"""
+
+from django.core.cache import caches
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+from core.cache import redis_client
+
+
+class CounterThrottleMixin:
+    """
+    Count requests per fixed window with a single atomic increment.
+
+    DRF's SimpleRateThrottle reads, trims and rewrites a timestamp list on
+    every request (two cache round trips, racy across workers). Here each
+    window has its own counter key; on Redis it is bumped with one
+    INCR + EXPIRE pipeline, elsewhere with cache.add()/incr().
+    """
+
+    cache = caches['throttling']
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.count = self._increment(f'{key}:{window}', self.duration)
+        if self.count <= self.num_requests:
+            return True
+        return self.throttle_failure()
+
+    def _increment(self, key, timeout):
+        client, redis_key = redis_client(self.cache, key)
+        if client is not None:
+            pipe = client.pipeline()
+            pipe.incr(redis_key)
+            pipe.expire(redis_key, timeout)
+            count, _ = pipe.execute()
+            return count
+
+        self.cache.add(key, 0, timeout)
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Expired between add() and incr(); start a fresh window
+            self.cache.set(key, 1, timeout)
+            return 1
+
+    def wait(self):
+        return self.duration - (self.now % self.duration)
+
+
+class AnonCounterThrottle(CounterThrottleMixin, AnonRateThrottle):
+    """AnonRateThrottle using the atomic counter."""
+
+
+class UserCounterThrottle(CounterThrottleMixin, UserRateThrottle):
+    """UserRateThrottle using the atomic counter."""
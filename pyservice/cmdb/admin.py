@@ -92,6 +92,7 @@ class UserAdmin(BaseUserAdmin):
 @admin.register(Asset)
 class AssetAdmin(admin.ModelAdmin):
     list_display = ['name', 'asset_type', 'serial_number', 'status', 'assigned_to', 'location']
+    list_select_related = ['assigned_to']
     list_filter = ['asset_type', 'status', 'manufacturer']
     search_fields = ['name', 'serial_number', 'model_name']
     ordering = ['-created_at']
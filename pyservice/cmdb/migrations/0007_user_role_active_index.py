@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cmdb', '0006_twofactordevice'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'is_active'], name='user_role_active'),
+        ),
+    ]
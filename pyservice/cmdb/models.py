@@ -12,6 +12,7 @@ This module implements ITIL-compliant asset management functionality:
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 
 class Department(models.Model):
@@ -52,6 +53,10 @@ class User(AbstractUser):
         ('manager', 'Manager'),
         ('admin', 'Administrator'),
     ]
+    # Roles that work incidents and service requests
+    SUPPORT_ROLES = frozenset({'it_support', 'technician', 'admin'})
+    # Departments whose members work the remote support queue
+    SUPPORT_DEPARTMENT_CODES = ('IT_DEPARTMENT', 'SERVICENOW_SUPPORT')
 
     department = models.ForeignKey(
         Department,
@@ -67,6 +72,10 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            # Report recipients and staff listings filter on role + active
+            models.Index(fields=['role', 'is_active'], name='user_role_active'),
+        ]
 
     def __str__(self):
         return f"{self.get_full_name() or self.username} ({self.role})"
@@ -78,6 +87,18 @@ class User(AbstractUser):
         """
         return Asset.objects.filter(status='in_stock')
 
+    @cached_property
+    def is_support_staff(self):
+        """
+        Check if user is IT support staff (admins and support departments).
+        Cached per instance, so request.user only loads its department once.
+        """
+        if self.role == 'admin':
+            return True
+        if self.department_id is None:
+            return False
+        return self.department.code in self.SUPPORT_DEPARTMENT_CODES
+
 
 class AssetInventory(models.Model):
     """
@@ -65,6 +65,19 @@ class TestUserModel:
         )
         available = user.get_available_assets()
         assert available.count() == 1
+    
+    def test_is_support_staff(self):
+        """Test support staff detection by role and department"""
+        it_dept = Department.objects.create(name="IT", code="IT_DEPARTMENT")
+        hr_dept = Department.objects.create(name="HR", code="HR")
+        admin = User.objects.create_user(username="admin1", password="test", role="admin")
+        tech = User.objects.create_user(username="tech", password="test", department=it_dept)
+        clerk = User.objects.create_user(username="clerk", password="test", department=hr_dept)
+        loner = User.objects.create_user(username="loner", password="test")
+        assert admin.is_support_staff
+        assert User.objects.get(pk=tech.pk).is_support_staff
+        assert not User.objects.get(pk=clerk.pk).is_support_staff
+        assert not loner.is_support_staff
 
 
 @pytest.mark.django_db
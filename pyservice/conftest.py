@@ -15,6 +15,23 @@ from service_requests.models import ServiceRequest
 User = get_user_model()
 
 
+# =============================================================================
+# Database Setup
+# =============================================================================
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker):
+    """
+    Add the MySQL FULLTEXT indexes search.fulltext.text_search needs.
+    They are created by RunPython migrations, which --nomigrations skips.
+    """
+    from django.db import connection
+    from search.fulltext import create_fulltext_indexes
+    
+    with django_db_blocker.unblock():
+        create_fulltext_indexes(connection)
+
+
 # =============================================================================
 # User Fixtures
 # =============================================================================
@@ -7,3 +7,12 @@ class CoreConfig(AppConfig):
     
     def ready(self):
         import core.signals  # noqa
+        
+        # Log directory for the 'file' handler (pre-created in the Docker image)
+        from django.conf import settings
+        (settings.BASE_DIR / 'logs').mkdir(exist_ok=True)
+        
+        from django.contrib import admin
+        admin.site.site_header = 'PyService Admin'
+        admin.site.site_title = 'PyService'
+        admin.site.index_title = 'Administration'
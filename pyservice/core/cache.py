@@ -0,0 +1,26 @@
+"""
+Cache Helpers
+PyService Mini-ITSM Platform
+"""
+
+from django.core.cache.backends.redis import RedisCache
+
+
+def redis_client(cache, key):
+    """
+    Raw redis-py client for key on a Django RedisCache, plus the prefixed
+    key to use with it; (None, None) for any other backend.
+
+    Django has no public accessor for the underlying client, so this is the
+    one place that reaches into RedisCache._cache. If a Django upgrade
+    changes those internals the callers get (None, None) and fall back to
+    the portable cache API instead of failing.
+    """
+    if not isinstance(cache, RedisCache):
+        return None, None
+    redis_key = cache.make_and_validate_key(key)
+    try:
+        client = cache._cache.get_client(redis_key, write=True)
+    except AttributeError:
+        return None, None
+    return client, redis_key
@@ -0,0 +1,25 @@
+"""
+Model Fields
+PyService Mini-ITSM Platform
+"""
+
+from django.db import models
+
+
+class EnumCharField(models.CharField):
+    """
+    CharField stored as a MySQL ENUM of its choices.
+
+    Each value takes one or two bytes on disk and in index entries instead
+    of a variable-length string, while the ORM still reads and writes the
+    plain strings. Other databases keep the usual varchar column. Changing
+    the choices needs a migration (ALTER TABLE ... MODIFY).
+    """
+
+    def db_type(self, connection):
+        if connection.vendor != 'mysql':
+            return super().db_type(connection)
+        values = ', '.join(
+            "'%s'" % str(value).replace("'", "''") for value, _ in self.flatchoices
+        )
+        return f'enum({values})'
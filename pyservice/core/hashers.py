@@ -0,0 +1,20 @@
+"""
+Password Hashers
+PyService Mini-ITSM Platform
+"""
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 hasher tuned for login latency.
+
+    Targets roughly 50ms per verification on application servers, well
+    below PBKDF2's default iteration count. Existing hashes with other
+    parameters are transparently upgraded on the next successful login.
+    """
+
+    time_cost = 2
+    memory_cost = 65536
+    parallelism = 2
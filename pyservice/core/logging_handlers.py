@@ -0,0 +1,53 @@
+"""
+Logging Handlers
+PyService Mini-ITSM Platform
+
+Non-blocking file logging for request-handling threads.
+"""
+
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class QueuedRotatingFileHandler(QueueHandler):
+    """
+    Rotating file handler that writes from a background thread.
+
+    Records are formatted on the calling thread and pushed onto an
+    in-memory queue; a QueueListener drains the queue into a
+    RotatingFileHandler, so file writes and rotation never block a
+    request. The listener is started lazily per process, so forked
+    workers each get their own writer thread.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, encoding=None):
+        super().__init__(queue.SimpleQueue())
+        self.file_handler = RotatingFileHandler(
+            filename,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=True,
+        )
+        self._listener = None
+        self._listener_pid = None
+
+    def _start_listener(self):
+        self._listener = QueueListener(self.queue, self.file_handler)
+        self._listener.start()
+        self._listener_pid = os.getpid()
+
+    def emit(self, record):
+        # Handler.handle() holds self.lock here, so the check is race-free
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def close(self):
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+            self._listener = None
+            self._listener_pid = None
+        self.file_handler.close()
+        super().close()
@@ -11,12 +11,26 @@ Custom middleware for:
 import time
 import json
 import logging
+from functools import wraps
 from django.utils import timezone
 from django.conf import settings
 
 logger = logging.getLogger('pyservice.audit')
 
 
+def audit_exempt(view_func):
+    """
+    Mark a view as exempt from per-request audit logging.
+    For high-frequency JSON endpoints (chat polling, transcripts) whose
+    actions are already recorded as rows in the database.
+    """
+    @wraps(view_func)
+    def wrapped_view(*args, **kwargs):
+        return view_func(*args, **kwargs)
+    wrapped_view.audit_exempt = True
+    return wrapped_view
+
+
 class AuditMiddleware:
     """
     Middleware for comprehensive request audit logging.
@@ -62,13 +76,19 @@ class AuditMiddleware:
         duration = time.time() - start_time
         
         # Log the request
-        self._log_request(request, response, duration, ip_address)
+        if not getattr(request, '_audit_exempt', False):
+            self._log_request(request, response, duration, ip_address)
         
         # Add timing header
         response['X-Request-Duration'] = f'{duration:.3f}s'
         
         return response
     
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Remember whether the resolved view opted out of audit logging."""
+        request._audit_exempt = getattr(view_func, 'audit_exempt', False)
+        return None
+    
     def _log_request(self, request, response, duration, ip_address):
         """Log request details for audit trail."""
         user = request.user if hasattr(request, 'user') and request.user.is_authenticated else None
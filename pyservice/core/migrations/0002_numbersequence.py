@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-16 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NumberSequence',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('value', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Number Sequence',
+                'verbose_name_plural': 'Number Sequences',
+            },
+        ),
+    ]
@@ -4,7 +4,8 @@ PyService Mini-ITSM Platform
 Audit trail for all model changes
 """
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
@@ -75,3 +76,38 @@ class ActivityLog(models.Model):
             content_type=content_type,
             object_id=obj.pk
         )[:limit]
+
+
+class NumberSequence(models.Model):
+    """
+    Named counter for human-facing record numbers (REQ0000123, ...).
+    MySQL has no sequences; bumping one row with UPDATE locks it until the
+    transaction ends, so concurrent callers never get the same value.
+    """
+    
+    name = models.CharField(max_length=50, primary_key=True)
+    value = models.PositiveBigIntegerField(default=0)
+    
+    class Meta:
+        verbose_name = 'Number Sequence'
+        verbose_name_plural = 'Number Sequences'
+    
+    def __str__(self):
+        return f"{self.name}: {self.value}"
+    
+    @classmethod
+    def next_value(cls, name, start=None):
+        """
+        Increment and return the named counter.
+        start is called once, when the counter does not exist yet, to seed
+        it (e.g. with the highest number already issued).
+        """
+        with transaction.atomic():
+            if not cls.objects.filter(name=name).update(value=F('value') + 1):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(name=name, value=start() if start else 0)
+                except IntegrityError:
+                    pass  # Seeded concurrently by another process
+                cls.objects.filter(name=name).update(value=F('value') + 1)
+            return cls.objects.filter(name=name).values_list('value', flat=True).get()
@@ -3,12 +3,15 @@ Core Signals - Automatic Activity Logging
 PyService Mini-ITSM Platform
 """
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 from incidents.models import Incident
 from service_requests.models import ServiceRequest
 from cmdb.models import Asset
+from knowledge.models import Article
+from pyservice.search import invalidate_search_cache
+from pyservice.sla_dashboard import invalidate_sla_dashboard_cache
 from .models import ActivityLog
 
 
@@ -125,3 +128,23 @@ def log_asset_changes(sender, instance, created, **kwargs):
                 obj=instance,
                 details=f"Assigned to {instance.assigned_to}"
             )
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_save, sender=ServiceRequest)
+@receiver(post_save, sender=Asset)
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Incident)
+@receiver(post_delete, sender=ServiceRequest)
+@receiver(post_delete, sender=Asset)
+@receiver(post_delete, sender=Article)
+def invalidate_search_results(sender, instance, **kwargs):
+    """Drop cached global search results when searchable data changes."""
+    invalidate_search_cache()
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+def invalidate_sla_dashboard(sender, instance, **kwargs):
+    """Drop cached SLA dashboards when any incident changes."""
+    invalidate_sla_dashboard_cache()
@@ -10,6 +10,7 @@ from .models import Incident
 @admin.register(Incident)
 class IncidentAdmin(admin.ModelAdmin):
     list_display = ['number', 'title', 'priority', 'state', 'caller', 'assigned_to', 'due_date', 'sla_breached']
+    list_select_related = ['caller', 'assigned_to']
     list_filter = ['state', 'priority', 'impact', 'urgency', 'sla_breached']
     search_fields = ['number', 'title', 'description']
     ordering = ['priority', '-created_at']
@@ -4,10 +4,19 @@ PyService Mini-ITSM Platform
 """
 
 from django import forms
+from cmdb.models import User
 from .models import Incident
 
 
 class IncidentForm(forms.ModelForm):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # The caller select only needs what User.__str__ shows
+        self.fields['caller'].queryset = User.objects.only(
+            'username', 'first_name', 'last_name', 'role'
+        )
+    
     class Meta:
         model = Incident
         fields = ['title', 'description', 'location', 'caller', 'assigned_to', 'impact', 'urgency', 
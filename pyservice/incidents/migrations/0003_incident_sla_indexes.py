@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 12:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0002_alter_incident_options_incident_location_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['sla_breached', 'state', 'due_date'], name='inc_sla_state_due'),
+        ),
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['priority', 'sla_breached'], name='inc_pri_breach'),
+        ),
+    ]
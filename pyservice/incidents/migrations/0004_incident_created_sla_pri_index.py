@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0003_incident_sla_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['created_at', 'sla_breached', 'priority'], name='inc_created_sla_pri'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0004_incident_created_sla_pri_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['resolved_at'], name='inc_resolved_idx'),
+        ),
+    ]
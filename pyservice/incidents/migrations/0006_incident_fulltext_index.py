@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-16 15:00
+
+from django.db import migrations
+
+
+# Backs search.fulltext.text_search; MySQL only (other databases fall
+# back to icontains and need no index)
+def add_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        # With the default stopword list the ngram parser drops every token
+        # containing a stopword ("a", "i", ...), so phrases with those letters
+        # never match. The setting is read when the index is built.
+        schema_editor.execute('SET SESSION innodb_ft_enable_stopword = OFF')
+        schema_editor.execute(
+            'CREATE FULLTEXT INDEX inc_text_ft ON incidents_incident (number, title, description) WITH PARSER ngram'
+        )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute('DROP INDEX inc_text_ft ON incidents_incident')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0005_incident_resolved_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+    ]
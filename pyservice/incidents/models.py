@@ -118,6 +118,14 @@ class Incident(models.Model):
             'priority',
             '-created_at'
         ]
+        indexes = [
+            # SLA dashboard: at-risk / breached lists and per-priority counts
+            models.Index(fields=['sla_breached', 'state', 'due_date'], name='inc_sla_state_due'),
+            models.Index(fields=['priority', 'sla_breached'], name='inc_pri_breach'),
+            # Reports: created_at range with SLA / priority breakdowns
+            models.Index(fields=['created_at', 'sla_breached', 'priority'], name='inc_created_sla_pri'),
+            models.Index(fields=['resolved_at'], name='inc_resolved_idx'),
+        ]
         verbose_name = 'Incident'
         verbose_name_plural = 'Incidents'
 
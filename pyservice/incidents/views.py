@@ -15,7 +15,11 @@ from cmdb.models import User
 @login_required
 def incident_list(request):
     """List all incidents with filtering."""
-    incidents = Incident.objects.all()
+    # The table shows neither long text column; callers and assignees are
+    # joined in rather than fetched per row
+    incidents = Incident.objects.select_related('caller', 'assigned_to').defer(
+        'description', 'resolution_notes'
+    )
     
     # Apply filters
     state = request.GET.get('state')
@@ -64,13 +68,9 @@ def incident_create(request):
         if request.user.role != 'admin':
             form.initial['caller'] = request.user.pk
     
-    users = User.objects.all()
-    it_users = User.objects.filter(role__in=['it_support', 'technician', 'admin'])
     is_admin = request.user.role == 'admin'
     return render(request, 'incidents/incident_form.html', {
         'form': form,
-        'users': users,
-        'it_users': it_users,
         'is_admin': is_admin
     })
 
@@ -88,13 +88,9 @@ def incident_update(request, pk):
     else:
         form = IncidentForm(instance=incident)
     
-    users = User.objects.all()
-    it_users = User.objects.filter(role__in=['it_support', 'technician', 'admin'])
     is_admin = request.user.role == 'admin'
     return render(request, 'incidents/incident_form.html', {
         'form': form,
-        'users': users,
-        'it_users': it_users,
         'is_admin': is_admin
     })
 
@@ -105,9 +101,9 @@ def incident_claim(request, pk):
     incident = get_object_or_404(Incident, pk=pk)
     if request.method == 'POST':
         # Only support roles can claim
-        if request.user.role in ['it_support', 'technician', 'admin']:
+        if request.user.role in User.SUPPORT_ROLES:
             if incident.claim(request.user):
-                messages.success(request, f'You are now assigned to this incident.')
+                messages.success(request, 'You are now assigned to this incident.')
             else:
                 messages.error(request, 'Cannot claim this incident.')
         else:
@@ -121,7 +117,7 @@ def incident_complete(request, pk):
     incident = get_object_or_404(Incident, pk=pk)
     if request.method == 'POST':
         # Only assigned user or admin can complete
-        if request.user == incident.assigned_to or request.user.role == 'admin':
+        if request.user.pk == incident.assigned_to_id or request.user.role == 'admin':
             if incident.complete():
                 messages.success(request, 'Incident marked as resolved!')
             else:
@@ -137,7 +133,7 @@ def incident_escalate(request, pk):
     incident = get_object_or_404(Incident, pk=pk)
     if request.method == 'POST':
         # Only assigned user can escalate
-        if request.user == incident.assigned_to or request.user.role == 'admin':
+        if request.user.pk == incident.assigned_to_id or request.user.role == 'admin':
             if incident.escalate('Needs advanced assistance'):
                 messages.warning(request, 'Incident escalated - needs advanced help.')
             else:
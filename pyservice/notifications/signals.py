@@ -4,6 +4,7 @@ PyService Mini-ITSM Platform
 Automatic notification creation on model changes
 """
 
+from django.db import transaction
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 from django.core.mail import send_mail
@@ -15,19 +16,29 @@ from service_requests.models import ServiceRequest
 from .models import Notification
 
 
+def _send_email(recipient, subject, message):
+    try:
+        send_mail(
+            subject=f"[PyService] {subject}",
+            message=message,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[recipient],
+            fail_silently=True,
+        )
+    except Exception:
+        pass  # Silently fail in development
+
+
 def send_notification_email(user, subject, message):
-    """Send email notification (console backend for development)."""
+    """
+    Send email notification (console backend for development).
+    Sent once the surrounding transaction commits, so a workflow view
+    holding the request's row lock doesn't keep it for the SMTP round
+    trip, and a rolled-back change sends nothing.
+    """
     if user.email:
-        try:
-            send_mail(
-                subject=f"[PyService] {subject}",
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[user.email],
-                fail_silently=True,
-            )
-        except Exception:
-            pass  # Silently fail in development
+        recipient = user.email
+        transaction.on_commit(lambda: _send_email(recipient, subject, message))
 
 
 @receiver(post_save, sender=Incident)
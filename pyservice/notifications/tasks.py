@@ -174,13 +174,13 @@ def send_daily_digest(user_id):
         
         # Get unread notifications from the last 24 hours
         yesterday = timezone.now() - timedelta(days=1)
-        notifications = Notification.objects.filter(
+        notifications = list(Notification.objects.filter(
             user=user,
             is_read=False,
             created_at__gte=yesterday
-        ).order_by('-created_at')[:10]
+        ).order_by('-created_at')[:10])
         
-        if not notifications.exists():
+        if not notifications:
             return {'status': 'no_notifications'}
         
         # Build email content
@@ -189,7 +189,7 @@ def send_daily_digest(user_id):
             for n in notifications
         ])
         
-        subject = f"Your Daily PyService Digest - {notifications.count()} unread notifications"
+        subject = f"Your Daily PyService Digest - {len(notifications)} unread notifications"
         message = f"""
 Hello {user.get_full_name() or user.username},
 
@@ -197,7 +197,7 @@ Here's your daily summary of unread notifications:
 
 {notification_list}
 
-{'... and more' if notifications.count() >= 10 else ''}
+{'... and more' if len(notifications) >= 10 else ''}
 
 Log in to PyService to view all notifications and take action.
 
@@ -214,7 +214,7 @@ PyService Mini-ITSM Platform
         )
         
         logger.info(f"Daily digest sent to {user.email}")
-        return {'status': 'sent', 'notification_count': notifications.count()}
+        return {'status': 'sent', 'notification_count': len(notifications)}
         
     except User.DoesNotExist:
         logger.error(f"User {user_id} not found for daily digest")
@@ -17,7 +17,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pyservice.settings')
 django_asgi_app = get_asgi_application()
 
 # Import WebSocket URL patterns after Django setup
-from notifications.routing import websocket_urlpatterns
+from notifications.routing import websocket_urlpatterns as notification_urlpatterns
+from remote_support.routing import websocket_urlpatterns as support_urlpatterns
+
+websocket_urlpatterns = notification_urlpatterns + support_urlpatterns
 
 application = ProtocolTypeRouter({
     # HTTP requests are handled by Django's ASGI application
@@ -9,6 +9,7 @@ Tasks include: email notifications, SLA monitoring, report generation.
 import os
 from celery import Celery
 from celery.schedules import crontab
+from decouple import config
 
 # Set the default Django settings module
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pyservice.settings')
@@ -40,6 +41,13 @@ app.conf.beat_schedule = {
         'options': {'queue': 'default'}
     },
     
+    # Rebuild the incident daily rollup before the summary reports
+    'refresh-incident-daily-stats': {
+        'task': 'reports.tasks.refresh_incident_daily_stats',
+        'schedule': crontab(hour=5, minute=30),
+        'options': {'queue': 'low_priority'}
+    },
+    
     # Generate daily summary report at 6 AM
     'generate-daily-report': {
         'task': 'reports.tasks.generate_daily_summary',
@@ -54,6 +62,13 @@ app.conf.beat_schedule = {
         'options': {'queue': 'low_priority'}
     },
     
+    # Delete exported report PDFs whose download link has expired
+    'cleanup-report-exports': {
+        'task': 'reports.tasks.cleanup_report_exports',
+        'schedule': crontab(minute=15),
+        'options': {'queue': 'low_priority'}
+    },
+    
     # Clean up old notifications every day at midnight
     'cleanup-old-notifications': {
         'task': 'notifications.tasks.cleanup_old_notifications',
@@ -69,6 +84,14 @@ app.conf.beat_schedule = {
     },
 }
 
+# Flush queued search index updates in bulk (only when search is enabled)
+if config('ELASTICSEARCH_ENABLED', default=False, cast=bool):
+    app.conf.beat_schedule['flush-search-index'] = {
+        'task': 'search.tasks.flush_search_index',
+        'schedule': 5.0,
+        'options': {'queue': 'default', 'expires': 5}
+    }
+
 # =============================================================================
 # Celery Configuration
 # =============================================================================
@@ -4,9 +4,13 @@ PyService Mini-ITSM Platform
 Search across all modules
 """
 
+import hashlib
+
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.db.models import Q
+from django.utils.text import Truncator
 
 from incidents.models import Incident
 from service_requests.models import ServiceRequest
@@ -14,55 +18,139 @@ from cmdb.models import Asset
 from knowledge.models import Article
 
 
+# Repeat queries (autocomplete, back/forward navigation) are served from cache
+SEARCH_CACHE_TIMEOUT = 60
+SEARCH_CACHE_VERSION_KEY = 'search:version'
+
+_INCIDENT_STATES = dict(Incident.STATE_CHOICES)
+_REQUEST_STATES = dict(ServiceRequest.STATE_CHOICES)
+_ASSET_STATUSES = dict(Asset.STATUS_CHOICES)
+
+
+def _user_label(row, field):
+    """User.__str__ for a user projected into a values() row, or None."""
+    username = row[f'{field}__username']
+    if username is None:
+        return None
+    full_name = f"{row[f'{field}__first_name']} {row[f'{field}__last_name']}".strip()
+    return f"{full_name or username} ({row[f'{field}__role']})"
+
+
+def invalidate_search_cache():
+    """
+    Invalidate all cached search results.
+
+    Bumps the version embedded in every search cache key, so stale
+    entries are simply never read again and expire on their own.
+    """
+    try:
+        cache.incr(SEARCH_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(SEARCH_CACHE_VERSION_KEY, 1, None)
+
+
+def _search_cache_key(user, query):
+    """Build the cache key for a query, scoped by user role."""
+    version = cache.get_or_set(SEARCH_CACHE_VERSION_KEY, 1, None)
+    digest = hashlib.blake2s(query.lower().encode(), digest_size=8).hexdigest()
+    return f'search:{version}:{user.role}:{digest}'
+
+
+def _run_search(query):
+    """Run the search queries and return lightweight, cacheable results."""
+    incidents = Incident.objects.filter(
+        Q(number__icontains=query) |
+        Q(title__icontains=query) |
+        Q(description__icontains=query)
+    ).values('pk', 'number', 'title', 'description', 'state', 'created_at')[:10]
+
+    requests = ServiceRequest.objects.filter(
+        Q(number__icontains=query) |
+        Q(title__icontains=query) |
+        Q(description__icontains=query)
+    ).values('pk', 'number', 'title', 'description', 'state', 'created_at')[:10]
+
+    assets = Asset.objects.filter(
+        Q(name__icontains=query) |
+        Q(serial_number__icontains=query) |
+        Q(model_name__icontains=query)
+    ).values(
+        'pk', 'name', 'serial_number', 'model_name', 'status', 'assigned_to__username',
+        'assigned_to__first_name', 'assigned_to__last_name', 'assigned_to__role',
+    )[:10]
+
+    articles = Article.objects.filter(
+        Q(title__icontains=query) |
+        Q(content__icontains=query) |
+        Q(summary__icontains=query),
+        is_published=True
+    ).values('slug', 'title', 'summary', 'updated_at', 'category__name')[:10]
+
+    return {
+        'incidents': [
+            {
+                'pk': inc['pk'],
+                'number': inc['number'],
+                'title': inc['title'],
+                'excerpt': Truncator(inc['description']).chars(100),
+                'state': inc['state'],
+                'state_display': _INCIDENT_STATES.get(inc['state'], inc['state']),
+                'created_at': inc['created_at'],
+            }
+            for inc in incidents
+        ],
+        'requests': [
+            {
+                'pk': req['pk'],
+                'number': req['number'],
+                'title': req['title'],
+                'excerpt': Truncator(req['description']).chars(100),
+                'state_display': _REQUEST_STATES.get(req['state'], req['state']),
+                'created_at': req['created_at'],
+            }
+            for req in requests
+        ],
+        'assets': [
+            {
+                'pk': asset['pk'],
+                'name': asset['name'],
+                'serial_number': asset['serial_number'],
+                'model_name': asset['model_name'],
+                'status_display': _ASSET_STATUSES.get(asset['status'], asset['status']),
+                'assigned_to': _user_label(asset, 'assigned_to'),
+            }
+            for asset in assets
+        ],
+        'articles': list(articles),
+    }
+
+
 @login_required
 def global_search(request):
     """Search across all modules."""
     query = request.GET.get('q', '').strip()
-    
+
     results = {
         'incidents': [],
         'requests': [],
         'assets': [],
         'articles': [],
     }
-    
+
     if query and len(query) >= 2:
-        # Search incidents
-        results['incidents'] = Incident.objects.filter(
-            Q(number__icontains=query) |
-            Q(title__icontains=query) |
-            Q(description__icontains=query)
-        )[:10]
-        
-        # Search service requests
-        results['requests'] = ServiceRequest.objects.filter(
-            Q(number__icontains=query) |
-            Q(title__icontains=query) |
-            Q(description__icontains=query)
-        )[:10]
-        
-        # Search assets
-        results['assets'] = Asset.objects.filter(
-            Q(name__icontains=query) |
-            Q(serial_number__icontains=query) |
-            Q(model_name__icontains=query)
-        )[:10]
-        
-        # Search knowledge base
-        results['articles'] = Article.objects.filter(
-            Q(title__icontains=query) |
-            Q(content__icontains=query) |
-            Q(summary__icontains=query),
-            is_published=True
-        )[:10]
-    
+        cache_key = _search_cache_key(request.user, query)
+        results = cache.get(cache_key)
+        if results is None:
+            results = _run_search(query)
+            cache.set(cache_key, results, SEARCH_CACHE_TIMEOUT)
+
     total_results = (
         len(results['incidents']) +
         len(results['requests']) +
         len(results['assets']) +
         len(results['articles'])
     )
-    
+
     return render(request, 'search_results.html', {
         'query': query,
         'results': results,
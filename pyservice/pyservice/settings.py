@@ -84,6 +84,7 @@ INSTALLED_APPS = [
     'reports',
     'core',
     'remote_support',
+    'search',
 ]
 
 MIDDLEWARE = [
@@ -143,8 +144,13 @@ DATABASES = {
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
             'charset': 'utf8mb4',
+            'connect_timeout': 3,
         },
-        'CONN_MAX_AGE': 60,  # Connection pooling
+        # Persistent connections: reuse each worker's connection across requests
+        # instead of reconnecting (TCP + auth) every time; health checks drop
+        # connections the server has closed before they are reused.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=300, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -163,7 +169,13 @@ if REDIS_AVAILABLE:
             'LOCATION': REDIS_URL,
             'KEY_PREFIX': 'pyservice',
             'TIMEOUT': 300,
-        }
+        },
+        # API rate-limit counters (shared by all workers)
+        'throttling': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'pyservice:throttle',
+        },
     }
     SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
     SESSION_CACHE_ALIAS = 'default'
@@ -173,7 +185,11 @@ else:
         'default': {
             'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
             'LOCATION': 'unique-snowflake',
-        }
+        },
+        'throttling': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'throttling',
+        },
     }
     # Use database sessions in development
     SESSION_ENGINE = 'django.contrib.sessions.backends.db'
@@ -223,6 +239,13 @@ CHANNEL_LAYERS = {
 # =============================================================================
 AUTH_USER_MODEL = 'cmdb.User'
 
+# Argon2 first; PBKDF2 kept so existing hashes still verify (and get upgraded)
+PASSWORD_HASHERS = [
+    'core.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator', 'OPTIONS': {'min_length': 8}},
@@ -243,14 +266,18 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-        'rest_framework.authentication.SessionAuthentication',
+        'api.authentication.CachedJWTAuthentication',
+        'api.authentication.CachedSessionAuthentication',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.DefaultCursorPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'api.throttling.AnonCounterThrottle',
+        'api.throttling.UserCounterThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/hour',
@@ -281,6 +308,16 @@ SIMPLE_JWT = {
     'TOKEN_OBTAIN_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenObtainPairSerializer',
 }
 
+# Ed25519 signing when a key pair is configured: other services can then
+# verify tokens with the public key alone, without sharing SECRET_KEY.
+JWT_SIGNING_KEY_FILE = config('JWT_SIGNING_KEY_FILE', default='')
+if JWT_SIGNING_KEY_FILE:
+    SIMPLE_JWT.update({
+        'ALGORITHM': 'EdDSA',
+        'SIGNING_KEY': Path(JWT_SIGNING_KEY_FILE).read_text(),
+        'VERIFYING_KEY': Path(config('JWT_VERIFYING_KEY_FILE')).read_text(),
+    })
+
 
 # =============================================================================
 # CORS CONFIGURATION
@@ -313,6 +350,8 @@ if ELASTICSEARCH_ENABLED:
             'hosts': config('ELASTICSEARCH_HOST', default='localhost:9200'),
         },
     }
+    # Queue document updates for search.tasks.flush_search_index
+    ELASTICSEARCH_DSL_SIGNAL_PROCESSOR = 'search.signals.DeferredSignalProcessor'
 
 
 # =============================================================================
@@ -346,7 +385,9 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 
-# WhiteNoise for static file serving
+# WhiteNoise for static file serving; collectstatic writes .gz and, with the
+# Brotli package installed, .br variants. Hashed (manifest) files are served
+# with a far-future immutable Cache-Control by WhiteNoise itself.
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 MEDIA_URL = '/media/'
@@ -401,8 +442,9 @@ LOGGING = {
             'formatter': 'json' if not DEBUG else 'verbose',
         },
         'file': {
+            # Writes happen on a background thread; see core.logging_handlers
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
+            '()': 'core.logging_handlers.QueuedRotatingFileHandler',
             'filename': BASE_DIR / 'logs' / 'pyservice.log',
             'maxBytes': 10485760,  # 10MB
             'backupCount': 5,
@@ -442,9 +484,6 @@ LOGGING = {
     },
 }
 
-# Create logs directory if it doesn't exist
-(BASE_DIR / 'logs').mkdir(exist_ok=True)
-
 
 # =============================================================================
 # DEFAULT PRIMARY KEY
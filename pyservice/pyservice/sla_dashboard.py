@@ -7,25 +7,68 @@ SLA compliance monitoring and risk analysis
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Count, Q
-import json
+from django.db.models import Case, Count, F, Q, When, Window
+from django.db.models.functions import RowNumber
+import orjson
 
 from incidents.models import Incident
 
 
-@login_required
-def sla_dashboard(request):
-    """SLA compliance and risk dashboard."""
-    if request.user.role not in ['admin', 'manager', 'it_support']:
-        messages.error(request, 'Unauthorized access.')
-        return redirect('dashboard')
-    
+# SLA state only changes when incidents are saved, so the page is cached
+# until the next incident change (or the timeout, for the "due < 4h" window)
+SLA_DASHBOARD_CACHE_TIMEOUT = 60
+SLA_DASHBOARD_CACHE_VERSION_KEY = 'sla_dash:version'
+
+_PRIORITIES = dict(Incident.PRIORITY_CHOICES)
+_PRIORITY_LABELS = [name for _, name in Incident.PRIORITY_CHOICES]
+
+# Columns the dashboard lists actually render (skips the wide text fields)
+_SUMMARY_FIELDS = (
+    'id', 'number', 'priority', 'due_date', 'sla_breached', 'assigned_to',
+    'assigned_to__username', 'assigned_to__first_name',
+    'assigned_to__last_name', 'assigned_to__role',
+)
+AT_RISK_LIMIT = 50
+
+
+def invalidate_sla_dashboard_cache():
+    """Invalidate every cached SLA dashboard by bumping the key version."""
+    try:
+        cache.incr(SLA_DASHBOARD_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(SLA_DASHBOARD_CACHE_VERSION_KEY, 1, None)
+
+
+def _incident_summary(incident):
+    """Plain-dict view of an incident row, cheap to pickle into the cache."""
+    return {
+        'pk': incident.pk,
+        'number': incident.number,
+        'due_date': incident.due_date,
+        'priority_display': _PRIORITIES.get(incident.priority, incident.priority),
+        'assigned_to': str(incident.assigned_to) if incident.assigned_to_id else None,
+    }
+
+
+def _compute_sla_context():
+    """Compute the SLA dashboard context."""
     now = timezone.now()
     
+    # Totals and breaches per priority in a single GROUP BY query
+    # (order_by() clears Meta.ordering, which would otherwise split the groups)
+    by_priority = {
+        row['priority']: row
+        for row in Incident.objects.order_by().values('priority').annotate(
+            total=Count('id'),
+            breached=Count('id', filter=Q(sla_breached=True)),
+        )
+    }
+    
     # Overall SLA stats
-    total_incidents = Incident.objects.count()
-    sla_breached = Incident.objects.filter(sla_breached=True).count()
+    total_incidents = sum(row['total'] for row in by_priority.values())
+    sla_breached = sum(row['breached'] for row in by_priority.values())
     sla_compliant = total_incidents - sla_breached
     sla_compliance_pct = round((sla_compliant / total_incidents * 100) if total_incidents > 0 else 100, 1)
     
@@ -33,21 +76,41 @@ def sla_dashboard(request):
     from datetime import timedelta
     warning_threshold = now + timedelta(hours=4)  # Due within 4 hours
     
-    at_risk = Incident.objects.filter(
-        due_date__lte=warning_threshold,
-        sla_breached=False
-    ).exclude(state__in=['resolved', 'closed']).order_by('due_date')
+    # At-risk and already-breached incidents in one query: rows are ranked
+    # within each group (at-risk by soonest due date, breached by most
+    # recent) so both lists come back already ordered and trimmed
+    rows = Incident.objects.filter(
+        Q(sla_breached=True) | Q(due_date__lte=warning_threshold)
+    ).exclude(state__in=['resolved', 'closed']).annotate(
+        group_rank=Window(
+            RowNumber(),
+            partition_by=F('sla_breached'),
+            order_by=[
+                Case(When(sla_breached=False, then=F('due_date'))).asc(),
+                Case(When(sla_breached=True, then=F('due_date'))).desc(),
+            ],
+        )
+    ).filter(
+        group_rank__lte=AT_RISK_LIMIT
+    ).select_related('assigned_to').only(
+        *_SUMMARY_FIELDS
+    ).order_by('group_rank')
     
-    # Already breached
-    breached = Incident.objects.filter(
-        sla_breached=True
-    ).exclude(state__in=['resolved', 'closed']).order_by('-due_date')[:10]
+    at_risk = []
+    breached = []
+    for inc in rows:
+        if inc.sla_breached:
+            breached.append(inc)
+        else:
+            at_risk.append(inc)
+    breached = breached[:10]
     
     # SLA by priority
     priority_stats = []
     for priority_code, priority_name in Incident.PRIORITY_CHOICES:
-        total_p = Incident.objects.filter(priority=priority_code).count()
-        breached_p = Incident.objects.filter(priority=priority_code, sla_breached=True).count()
+        row = by_priority.get(priority_code, {})
+        total_p = row.get('total', 0)
+        breached_p = row.get('breached', 0)
         compliant_p = total_p - breached_p
         pct = round((compliant_p / total_p * 100) if total_p > 0 else 100, 1)
         priority_stats.append({
@@ -59,21 +122,36 @@ def sla_dashboard(request):
         })
     
     # Chart data for SLA by priority
-    chart_priority_data = json.dumps({
-        'labels': [p['priority'] for p in priority_stats],
+    chart_priority_data = orjson.dumps({
+        'labels': _PRIORITY_LABELS,
         'compliant': [p['compliant'] for p in priority_stats],
         'breached': [p['breached'] for p in priority_stats],
-    })
+    }).decode()
     
-    context = {
+    return {
         'total_incidents': total_incidents,
         'sla_compliant': sla_compliant,
         'sla_breached': sla_breached,
         'sla_compliance_pct': sla_compliance_pct,
-        'at_risk': at_risk,
-        'breached': breached,
+        'at_risk': [_incident_summary(inc) for inc in at_risk],
+        'breached': [_incident_summary(inc) for inc in breached],
         'priority_stats': priority_stats,
         'chart_priority_data': chart_priority_data,
     }
+
+
+@login_required
+def sla_dashboard(request):
+    """SLA compliance and risk dashboard."""
+    if request.user.role not in ['admin', 'manager', 'it_support']:
+        messages.error(request, 'Unauthorized access.')
+        return redirect('dashboard')
+    
+    version = cache.get_or_set(SLA_DASHBOARD_CACHE_VERSION_KEY, 1, None)
+    context = cache.get_or_set(
+        f'sla_dash:{version}:{request.user.role}',
+        _compute_sla_context,
+        SLA_DASHBOARD_CACHE_TIMEOUT,
+    )
     
     return render(request, 'sla_dashboard.html', context)
@@ -89,17 +89,9 @@ urlpatterns = [
     path('', include('django_prometheus.urls')),
 ]
 
-# Admin site customization
-admin.site.site_header = 'PyService Admin'
-admin.site.site_title = 'PyService'
-admin.site.index_title = 'Administration'
-
-# Debug toolbar (development only)
-if settings.DEBUG:
-    try:
-        import debug_toolbar
-        urlpatterns = [
-            path('__debug__/', include(debug_toolbar.urls)),
-        ] + urlpatterns
-    except ImportError:
-        pass
+# Debug toolbar (development only; never imported unless installed)
+if settings.DEBUG and 'debug_toolbar' in settings.INSTALLED_APPS:
+    import debug_toolbar
+    urlpatterns = [
+        path('__debug__/', include(debug_toolbar.urls)),
+    ] + urlpatterns
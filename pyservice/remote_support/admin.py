@@ -11,11 +11,15 @@ class SessionMessageInline(admin.TabularInline):
     model = SessionMessage
     extra = 0
     readonly_fields = ['sender', 'message', 'created_at']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('sender')
 
 
 @admin.register(RemoteSupportSession)
 class RemoteSupportSessionAdmin(admin.ModelAdmin):
     list_display = ['session_code', 'subject', 'requester', 'technician', 'status', 'priority', 'created_at']
+    list_select_related = ['requester', 'technician']
     list_filter = ['status', 'priority', 'created_at']
     search_fields = ['session_code', 'subject', 'requester__username', 'technician__username']
     readonly_fields = ['session_code', 'created_at', 'accepted_at', 'completed_at']
@@ -25,4 +29,5 @@ class RemoteSupportSessionAdmin(admin.ModelAdmin):
 @admin.register(SessionMessage)
 class SessionMessageAdmin(admin.ModelAdmin):
     list_display = ['session', 'sender', 'message', 'created_at']
+    list_select_related = ['session', 'sender']
     list_filter = ['created_at']
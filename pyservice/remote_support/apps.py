@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class RemoteSupportConfig(AppConfig):
+    name = 'remote_support'
+
+    def ready(self):
+        import remote_support.signals  # noqa
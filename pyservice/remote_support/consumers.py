@@ -0,0 +1,77 @@
+"""
+Remote Support Consumers
+PyService Mini-ITSM Platform
+
+WebSocket consumer pushing session chat and status changes in real time.
+"""
+
+import json
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.db import database_sync_to_async
+
+
+def session_group_name(session_code):
+    """Channel layer group for everyone viewing a support session."""
+    return f'support_session_{session_code}'
+
+
+class SessionChatConsumer(AsyncWebsocketConsumer):
+    """
+    WebSocket consumer for a support session room.
+    Replaces the room's AJAX polling: new messages and status changes are
+    pushed as they happen, in the same shape get_messages returns.
+    """
+
+    async def connect(self):
+        """Handle WebSocket connection."""
+        self.user = self.scope.get('user')
+
+        if not self.user or not self.user.is_authenticated:
+            await self.close(code=4001)
+            return
+
+        session_code = self.scope['url_route']['kwargs']['session_code']
+        if not await self.can_join(session_code):
+            await self.close(code=4003)
+            return
+
+        self.session_group = session_group_name(session_code)
+        await self.channel_layer.group_add(
+            self.session_group,
+            self.channel_name
+        )
+
+        await self.accept()
+
+    async def disconnect(self, close_code):
+        """Handle WebSocket disconnection."""
+        if hasattr(self, 'session_group'):
+            await self.channel_layer.group_discard(
+                self.session_group,
+                self.channel_name
+            )
+
+    async def chat_message(self, event):
+        """Handle a new chat message broadcast to the session."""
+        message = dict(event['message'], is_self=event['sender_id'] == self.user.pk)
+        await self.send(text_data=json.dumps({
+            'messages': [message],
+        }))
+
+    async def session_update(self, event):
+        """Handle session status / voice state changes."""
+        await self.send(text_data=json.dumps({
+            'session_status': event['status'],
+            'is_voice_active': event['is_voice_active'],
+        }))
+
+    @database_sync_to_async
+    def can_join(self, session_code):
+        """Same access rule as the session room view."""
+        from .models import RemoteSupportSession
+        from .views import can_access_session
+
+        session = RemoteSupportSession.objects.filter(session_code=session_code).first()
+        if session is None:
+            return False
+        return can_access_session(self.user, session)
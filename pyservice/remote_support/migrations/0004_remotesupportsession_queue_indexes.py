@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('remote_support', '0003_remotesupportsession_is_voice_active_voicetranscript'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='remotesupportsession',
+            index=models.Index(fields=['status', '-priority', 'created_at'], name='rss_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='remotesupportsession',
+            index=models.Index(fields=['status', 'technician', 'completed_at'], name='rss_tech_done_idx'),
+        ),
+    ]
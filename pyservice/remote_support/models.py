@@ -5,17 +5,39 @@ PyService Mini-ITSM Platform
 Models for remote support session management.
 """
 
+import base64
 import secrets
-import string
-from django.db import models
+from types import MappingProxyType
+from django.db import models, transaction, IntegrityError
 from django.conf import settings
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+# Retries on the (~2^-40 per pair) chance of a session code collision
+SESSION_CODE_ATTEMPTS = 3
+
+
+# Bootstrap color classes for priority/status badges
+PRIORITY_COLORS = MappingProxyType({
+    'low': 'success',
+    'medium': 'info',
+    'high': 'warning',
+    'urgent': 'danger',
+})
+
+STATUS_COLORS = MappingProxyType({
+    'pending': 'warning',
+    'accepted': 'info',
+    'in_progress': 'primary',
+    'completed': 'success',
+    'cancelled': 'secondary',
+})
 
 
 def generate_session_code():
-    """Generate a unique 8-character session code."""
-    chars = string.ascii_uppercase + string.digits
-    return ''.join(secrets.choice(chars) for _ in range(8))
+    """Generate an 8-character session code (A-Z, 2-7) from 40 random bits."""
+    return base64.b32encode(secrets.token_bytes(5)).decode('ascii')
 
 
 class RemoteSupportSession(models.Model):
@@ -77,19 +99,40 @@ class RemoteSupportSession(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Support queue: pending list, technician's active/completed lists
+            models.Index(fields=['status', '-priority', 'created_at'], name='rss_queue_idx'),
+            models.Index(fields=['status', 'technician', 'completed_at'], name='rss_tech_done_idx'),
+        ]
         verbose_name = 'Remote Support Session'
         verbose_name_plural = 'Remote Support Sessions'
     
     def __str__(self):
         return f"{self.session_code} - {self.subject}"
     
+    def save(self, *args, **kwargs):
+        """Save, drawing a new session code if the random one is taken."""
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+        
+        for attempt in range(SESSION_CODE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                collided = RemoteSupportSession.objects.filter(session_code=self.session_code).exists()
+                if not collided or attempt == SESSION_CODE_ATTEMPTS - 1:
+                    raise
+                self.session_code = generate_session_code()
+    
     def accept(self, technician):
         """Accept the session by a technician."""
         if self.status == 'pending':
             self.technician = technician
             self.status = 'accepted'
             self.accepted_at = timezone.now()
-            self.save()
+            self.save(update_fields=['technician', 'status', 'accepted_at'])
+            self.__dict__.pop('duration', None)
             return True
         return False
     
@@ -97,7 +140,7 @@ class RemoteSupportSession(models.Model):
         """Start the session."""
         if self.status == 'accepted':
             self.status = 'in_progress'
-            self.save()
+            self.save(update_fields=['status'])
             return True
         return False
     
@@ -107,7 +150,8 @@ class RemoteSupportSession(models.Model):
             self.status = 'completed'
             self.completed_at = timezone.now()
             self.technician_notes = notes
-            self.save()
+            self.save(update_fields=['status', 'completed_at', 'technician_notes'])
+            self.__dict__.pop('duration', None)
             return True
         return False
     
@@ -115,11 +159,11 @@ class RemoteSupportSession(models.Model):
         """Cancel the session."""
         if self.status in ['pending', 'accepted']:
             self.status = 'cancelled'
-            self.save()
+            self.save(update_fields=['status'])
             return True
         return False
     
-    @property
+    @cached_property
     def duration(self):
         """Calculate session duration."""
         if self.accepted_at and self.completed_at:
@@ -128,24 +172,11 @@ class RemoteSupportSession(models.Model):
     
     def get_priority_color(self):
         """Get Bootstrap color class for priority."""
-        colors = {
-            'low': 'success',
-            'medium': 'info',
-            'high': 'warning',
-            'urgent': 'danger',
-        }
-        return colors.get(self.priority, 'secondary')
+        return PRIORITY_COLORS.get(self.priority, 'secondary')
     
     def get_status_color(self):
         """Get Bootstrap color class for status."""
-        colors = {
-            'pending': 'warning',
-            'accepted': 'info',
-            'in_progress': 'primary',
-            'completed': 'success',
-            'cancelled': 'secondary',
-        }
-        return colors.get(self.status, 'secondary')
+        return STATUS_COLORS.get(self.status, 'secondary')
 
 
 class SessionMessage(models.Model):
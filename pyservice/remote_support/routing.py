@@ -0,0 +1,13 @@
+"""
+WebSocket URL Routing
+PyService Mini-ITSM Platform
+
+URL patterns for remote support WebSocket connections.
+"""
+
+from django.urls import re_path
+from . import consumers
+
+websocket_urlpatterns = [
+    re_path(r'ws/support/(?P<session_code>\w+)/$', consumers.SessionChatConsumer.as_asgi()),
+]
@@ -0,0 +1,76 @@
+"""
+Remote Support Signals
+PyService Mini-ITSM Platform
+
+Push chat messages and session changes to connected session rooms.
+"""
+
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .consumers import session_group_name
+from .models import RemoteSupportSession, SessionMessage
+from .views import invalidate_session_cache
+
+logger = logging.getLogger(__name__)
+
+
+def broadcast_to_session(session_code, event):
+    """Send an event to every socket in a session room."""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    try:
+        async_to_sync(channel_layer.group_send)(session_group_name(session_code), event)
+    except Exception:
+        # Rooms fall back to polling get_messages; never fail the write
+        logger.warning("Could not broadcast to support session %s", session_code, exc_info=True)
+
+
+@receiver(post_save, sender=SessionMessage)
+def broadcast_new_message(sender, instance, created, **kwargs):
+    """Push a new chat message to the session room."""
+    if not created:
+        return
+
+    event = {
+        'type': 'chat.message',
+        'sender_id': instance.sender_id,
+        # Same shape as get_messages; is_self is resolved per socket
+        'message': {
+            'id': instance.id,
+            'sender': instance.sender.get_full_name() or instance.sender.username,
+            'message': instance.message,
+            'time': instance.created_at.strftime('%H:%M'),
+        },
+    }
+    session_code = instance.session.session_code
+    transaction.on_commit(lambda: broadcast_to_session(session_code, event))
+
+
+@receiver(post_save, sender=RemoteSupportSession)
+def broadcast_session_update(sender, instance, created, **kwargs):
+    """Push status and voice state changes to the session room."""
+    if created:
+        return
+
+    event = {
+        'type': 'session.update',
+        'status': instance.status,
+        'is_voice_active': instance.is_voice_active,
+    }
+    session_code = instance.session_code
+    transaction.on_commit(lambda: broadcast_to_session(session_code, event))
+
+
+@receiver(post_save, sender=RemoteSupportSession)
+@receiver(post_delete, sender=RemoteSupportSession)
+def invalidate_cached_session(sender, instance, **kwargs):
+    """Drop the chat endpoints' cached copy once the change is committed."""
+    session_code = instance.session_code
+    transaction.on_commit(lambda: invalidate_session_cache(session_code))
@@ -10,17 +10,47 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.http import require_POST
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Q
 
+from core.middleware import audit_exempt
+
 from .models import RemoteSupportSession, SessionMessage, VoiceTranscript
 
 def is_support_staff(user):
     """Check if user is IT support staff."""
-    if user.role == 'admin':
+    return user.is_support_staff
+
+
+# Chat endpoints are polled every few seconds; the session row rarely changes
+SESSION_CACHE_TIMEOUT = 30
+
+
+def session_cache_key(session_code):
+    return f'support_session:{session_code}'
+
+
+def invalidate_session_cache(session_code):
+    """Drop the cached session (called from the session post_save signal)."""
+    cache.delete(session_cache_key(session_code))
+
+
+def get_session_cached(session_code):
+    """Look up a session by code, served from cache for the chat endpoints."""
+    key = session_cache_key(session_code)
+    session = cache.get(key)
+    if session is None:
+        session = get_object_or_404(RemoteSupportSession, session_code=session_code)
+        cache.set(key, session, SESSION_CACHE_TIMEOUT)
+    return session
+
+
+def can_access_session(user, session):
+    """Participants and IT staff may use a session's chat and transcript."""
+    if user.pk in (session.requester_id, session.technician_id):
         return True
-    if user.department:
-        return user.department.code in ['IT_DEPARTMENT', 'SERVICENOW_SUPPORT']
-    return False
+    return is_support_staff(user)
 
 
 @login_required
@@ -38,20 +68,22 @@ def request_support(request):
         initial_message = request.POST.get('initial_message', '').strip()
         
         if subject and description and anydesk_id:
-            session = RemoteSupportSession.objects.create(
-                requester=request.user,
-                subject=subject,
-                description=description,
-                priority=priority,
-                anydesk_id=anydesk_id
-            )
-            # Create initial message if provided
-            if initial_message:
-                SessionMessage.objects.create(
-                    session=session,
-                    sender=request.user,
-                    message=initial_message
+            # Session and its opening message commit together
+            with transaction.atomic():
+                session = RemoteSupportSession.objects.create(
+                    requester=request.user,
+                    subject=subject,
+                    description=description,
+                    priority=priority,
+                    anydesk_id=anydesk_id
                 )
+                # Create initial message if provided
+                if initial_message:
+                    SessionMessage.objects.create(
+                        session=session,
+                        sender=request.user,
+                        message=initial_message
+                    )
             messages.success(request, 'Support request created! Waiting for a technician to connect.')
             return redirect('remote_session_room', session_code=session.session_code)
         else:
@@ -67,17 +99,18 @@ def support_queue(request):
         messages.error(request, 'Access denied. IT staff only.')
         return redirect('dashboard')
     
-    pending = RemoteSupportSession.objects.filter(status='pending').order_by('-priority', 'created_at')
-    active = RemoteSupportSession.objects.filter(
+    sessions = RemoteSupportSession.objects.select_related('requester', 'technician')
+    pending = sessions.filter(status='pending').order_by('-priority', 'created_at')
+    active = sessions.filter(
         status__in=['accepted', 'in_progress'],
         technician=request.user
     )
     
     if request.user.role == 'admin':
-        completed = RemoteSupportSession.objects.filter(status='completed').order_by('-completed_at')[:50]
+        completed = sessions.filter(status='completed').order_by('-completed_at')[:50]
     else:
         # Non-admin staff only see their own completed sessions
-        completed = RemoteSupportSession.objects.filter(
+        completed = sessions.filter(
             status='completed', 
             technician=request.user
         ).order_by('-completed_at')[:50]
@@ -119,7 +152,7 @@ def session_room(request, session_code):
             return redirect('dashboard')
     
     # Get chat messages
-    chat_messages = session.messages.all()
+    chat_messages = session.messages.select_related('sender')
     
     # Determine user role in session
     is_technician = request.user == session.technician or is_support_staff(request.user)
@@ -131,16 +164,16 @@ def session_room(request, session_code):
     })
 
 
+@audit_exempt
 @login_required
 @require_POST
 def send_message(request, session_code):
     """Send a chat message in the session."""
-    session = get_object_or_404(RemoteSupportSession, session_code=session_code)
+    session = get_session_cached(session_code)
     
     # Check access
-    if request.user != session.requester and request.user != session.technician:
-        if not is_support_staff(request.user):
-            return JsonResponse({'error': 'Access denied'}, status=403)
+    if not can_access_session(request.user, session):
+        return JsonResponse({'error': 'Access denied'}, status=403)
     
     message_text = request.POST.get('message', '').strip()
     if message_text:
@@ -162,13 +195,19 @@ def send_message(request, session_code):
     return JsonResponse({'error': 'Empty message'}, status=400)
 
 
+@audit_exempt
 @login_required
 def get_messages(request, session_code):
     """Get new messages for the session (AJAX polling)."""
-    session = get_object_or_404(RemoteSupportSession, session_code=session_code)
+    session = get_session_cached(session_code)
+    
+    # Check access
+    if not can_access_session(request.user, session):
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
     last_id = int(request.GET.get('last_id', 0))
     
-    new_messages = session.messages.filter(id__gt=last_id)
+    new_messages = session.messages.filter(id__gt=last_id).select_related('sender')
     
     return JsonResponse({
         'messages': [
@@ -247,7 +286,7 @@ def escalate_session(request, session_code):
         if '[ADVANCED HELP]' not in session.subject:
             session.subject = f"[ADVANCED HELP] {session.subject}"
             
-        session.save()
+        session.save(update_fields=['technician', 'status', 'priority', 'subject'])
         
         # Add system message
         SessionMessage.objects.create(
@@ -266,7 +305,7 @@ def escalate_session(request, session_code):
 @login_required
 def my_sessions(request):
     """View user's support session history."""
-    sessions = RemoteSupportSession.objects.filter(requester=request.user)
+    sessions = RemoteSupportSession.objects.filter(requester=request.user).select_related('technician')
     
     return render(request, 'remote_support/my_sessions.html', {
         'sessions': sessions,
@@ -277,30 +316,31 @@ def my_sessions(request):
 @require_POST
 def toggle_voice(request, session_code):
     """Toggle voice transcript status."""
-    session = get_object_or_404(RemoteSupportSession, session_code=session_code)
+    session = get_session_cached(session_code)
     
     # Check access
-    if request.user != session.requester and request.user != session.technician:
-        if not is_support_staff(request.user):
-            return JsonResponse({'error': 'Access denied'}, status=403)
+    if not can_access_session(request.user, session):
+        return JsonResponse({'error': 'Access denied'}, status=403)
             
     active = request.POST.get('active') == 'true'
-    session.is_voice_active = active
-    session.save()
+    # Speech recognition auto-restarts re-send the same state; only write changes
+    if session.is_voice_active != active:
+        session.is_voice_active = active
+        session.save(update_fields=['is_voice_active'])
     
     return JsonResponse({'success': True, 'is_voice_active': session.is_voice_active})
 
 
+@audit_exempt
 @login_required
 @require_POST
 def save_transcript(request, session_code):
     """Save a chunk of voice transcript."""
-    session = get_object_or_404(RemoteSupportSession, session_code=session_code)
+    session = get_session_cached(session_code)
     
     # Check access
-    if request.user != session.requester and request.user != session.technician:
-        if not is_support_staff(request.user):
-            return JsonResponse({'error': 'Access denied'}, status=403)
+    if not can_access_session(request.user, session):
+        return JsonResponse({'error': 'Access denied'}, status=403)
             
     text = request.POST.get('text', '').strip()
     if text:
@@ -313,21 +353,34 @@ def save_transcript(request, session_code):
     return JsonResponse({'error': 'Empty text'}, status=400)
 
 
+@audit_exempt
 @login_required
 def get_full_transcript(request, session_code):
-    """Get full voice transcript for the session."""
-    session = get_object_or_404(RemoteSupportSession, session_code=session_code)
+    """
+    Get the voice transcript for the session.
+    Pass ?after_id=<next_cursor> to fetch only entries added since the
+    previous call; without it the full transcript is returned.
+    """
+    session = get_session_cached(session_code)
     
     # Check access
-    if request.user != session.requester and request.user != session.technician:
-        if not is_support_staff(request.user):
-            return JsonResponse({'error': 'Access denied'}, status=403)
+    if not can_access_session(request.user, session):
+        return JsonResponse({'error': 'Access denied'}, status=403)
             
-    transcripts = session.voice_transcripts.all().order_by('created_at')
+    try:
+        after_id = int(request.GET.get('after_id', 0))
+    except ValueError:
+        after_id = 0
+    
+    transcripts = list(
+        session.voice_transcripts.filter(id__gt=after_id).select_related('speaker').order_by('id')
+    )
     
     return JsonResponse({
+        'next_cursor': transcripts[-1].id if transcripts else after_id,
         'transcripts': [
             {
+                'id': t.id,
                 'speaker': t.speaker.get_full_name() or t.speaker.username,
                 'text': t.text,
                 'time': t.created_at.strftime('%H:%M:%S'),
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-16 13:50
+
+import datetime
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IncidentDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('priority', models.IntegerField()),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('sla_breached', models.PositiveIntegerField(default=0)),
+                ('resolved', models.PositiveIntegerField(default=0)),
+                ('resolution_time', models.DurationField(default=datetime.timedelta(0))),
+                ('assigned_to', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Incident Daily Stat',
+                'verbose_name_plural': 'Incident Daily Stats',
+                'indexes': [models.Index(fields=['day'], name='ids_day'), models.Index(fields=['assigned_to', 'day'], name='ids_assignee_day')],
+            },
+        ),
+    ]
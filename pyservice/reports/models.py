@@ -4,4 +4,87 @@ PyService Mini-ITSM Platform
 PDF and Excel export functionality
 """
 
-from django.db import models
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+
+
+class IncidentDailyStat(models.Model):
+    """
+    Per-day incident rollup for the summary reports.
+    One row per (day, priority, assignee); created/breached count incidents
+    created that day, resolved/resolution_time count incidents resolved that
+    day. Rebuilt nightly by reports.tasks.refresh_incident_daily_stats, so
+    weekly and monthly reports sum a few hundred rows instead of scanning
+    the incidents table.
+    """
+    
+    day = models.DateField()
+    priority = models.IntegerField()
+    assigned_to = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+    created = models.PositiveIntegerField(default=0)
+    sla_breached = models.PositiveIntegerField(default=0)
+    resolved = models.PositiveIntegerField(default=0)
+    resolution_time = models.DurationField(default=timedelta(0))
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['day'], name='ids_day'),
+            models.Index(fields=['assigned_to', 'day'], name='ids_assignee_day'),
+        ]
+        verbose_name = 'Incident Daily Stat'
+        verbose_name_plural = 'Incident Daily Stats'
+    
+    def __str__(self):
+        return f"{self.day} P{self.priority}: {self.created} created, {self.resolved} resolved"
+    
+    @classmethod
+    def rebuild(cls):
+        """Recompute the whole rollup from the incidents table."""
+        from django.db.models import Count, F, Q, Sum
+        from django.db.models.functions import TruncDate
+        from incidents.models import Incident
+        
+        rows = {}
+        
+        def row(day, priority, assigned_to_id):
+            key = (day, priority, assigned_to_id)
+            if key not in rows:
+                rows[key] = cls(day=day, priority=priority, assigned_to_id=assigned_to_id)
+            return rows[key]
+        
+        created = Incident.objects.order_by().annotate(
+            day=TruncDate('created_at')
+        ).values('day', 'priority', 'assigned_to').annotate(
+            total=Count('id'),
+            breached=Count('id', filter=Q(sla_breached=True)),
+        )
+        for r in created:
+            stat = row(r['day'], r['priority'], r['assigned_to'])
+            stat.created = r['total']
+            stat.sla_breached = r['breached']
+        
+        resolved = Incident.objects.order_by().filter(resolved_at__isnull=False).annotate(
+            day=TruncDate('resolved_at')
+        ).values('day', 'priority', 'assigned_to').annotate(
+            total=Count('id'),
+            duration=Sum(F('resolved_at') - F('created_at')),
+        )
+        for r in resolved:
+            stat = row(r['day'], r['priority'], r['assigned_to'])
+            stat.resolved = r['total']
+            stat.resolution_time = r['duration'] or timedelta(0)
+        
+        # Swap the contents atomically so readers never see a half-built table
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(rows.values(), batch_size=1000)
+        
+        return len(rows)
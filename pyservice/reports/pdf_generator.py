@@ -5,9 +5,14 @@ PyService Mini-ITSM Platform
 Generate PDF reports using ReportLab.
 """
 
+import hashlib
+from functools import lru_cache
 from io import BytesIO
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from django.core.cache import cache
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.http import HttpResponse
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, landscape
@@ -24,6 +29,104 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Identical inputs render identical reports; keep the bytes for a while
+REPORT_CACHE_TIMEOUT = 600
+
+_PRIORITY_LABELS = {1: 'P1 - Critical', 2: 'P2 - High', 3: 'P3 - Medium', 4: 'P4 - Low'}
+_DATETIME_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def _build_styles():
+    """Build the sample stylesheet plus the report's custom paragraph styles."""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.HexColor('#1a365d')
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='SectionTitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceBefore=20,
+        spaceAfter=10,
+        textColor=colors.HexColor('#2c5282')
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='MetricValue',
+        parent=styles['Normal'],
+        fontSize=28,
+        alignment=1,  # Center
+        textColor=colors.HexColor('#2d3748')
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='MetricLabel',
+        parent=styles['Normal'],
+        fontSize=10,
+        alignment=1,
+        textColor=colors.HexColor('#718096')
+    ))
+    
+    return styles
+
+
+def _truncate(text, length):
+    """Shorten text for a table cell, marking the cut with an ellipsis."""
+    return text[:length] + ('...' if len(text) > length else '')
+
+
+def _incidents_created_between(start_date, end_date):
+    """
+    Incidents created on or between two local dates.
+    Compares created_at against a datetime range rather than
+    created_at__date, so no per-row timezone/date conversion is needed.
+    """
+    from incidents.models import Incident
+    
+    tz = timezone.get_current_timezone()
+    return Incident.objects.filter(
+        created_at__gte=datetime.combine(start_date, time.min, tzinfo=tz),
+        created_at__lt=datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=tz)
+    )
+
+
+@lru_cache(maxsize=8)
+def _table_style(header_color):
+    """Shared table style per header colour; Table.setStyle only reads it."""
+    return TableStyle([
+        # Header
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        
+        # Body
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#2d3748')),
+        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        
+        # Alternating rows
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
+        
+        # Grid
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+    ])
+
+
+# Styles are never mutated by the generators; build them once per process
+_STYLES = _build_styles()
+
 
 class PDFReportGenerator:
     """Base class for PDF report generation."""
@@ -31,49 +134,13 @@ class PDFReportGenerator:
     def __init__(self, title="Report", author="PyService ITSM"):
         self.title = title
         self.author = author
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
-        self.styles.add(ParagraphStyle(
-            name='ReportTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor('#1a365d')
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='SectionTitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.HexColor('#2c5282')
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='MetricValue',
-            parent=self.styles['Normal'],
-            fontSize=28,
-            alignment=1,  # Center
-            textColor=colors.HexColor('#2d3748')
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='MetricLabel',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            alignment=1,
-            textColor=colors.HexColor('#718096')
-        ))
+        self.styles = _STYLES
     
     def create_header(self, elements):
         """Create report header."""
         elements.append(Paragraph(self.title, self.styles['ReportTitle']))
         elements.append(Paragraph(
-            f"Generated: {timezone.now().strftime('%Y-%m-%d %H:%M')} | {self.author}",
+            f"Generated: {timezone.now().strftime(_DATETIME_FORMAT)} | {self.author}",
             self.styles['Normal']
         ))
         elements.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#e2e8f0')))
@@ -82,38 +149,16 @@ class PDFReportGenerator:
     def create_table(self, data, col_widths=None, header_color='#2c5282'):
         """Create a styled table."""
         table = Table(data, colWidths=col_widths)
-        
-        style = TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            
-            # Body
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#2d3748')),
-            ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            
-            # Alternating rows
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-            
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-        ])
-        
-        table.setStyle(style)
+        table.setStyle(_table_style(header_color))
         return table
     
-    def generate_pdf(self, elements):
-        """Generate PDF from elements."""
-        buffer = BytesIO()
+    def generate_pdf(self, elements, output=None):
+        """
+        Generate PDF from elements.
+        Builds into ``output`` (any writable file-like) when given,
+        otherwise into a new in-memory buffer rewound for reading.
+        """
+        buffer = output if output is not None else BytesIO()
         doc = SimpleDocTemplate(
             buffer,
             pagesize=A4,
@@ -124,7 +169,8 @@ class PDFReportGenerator:
         )
         
         doc.build(elements)
-        buffer.seek(0)
+        if output is None:
+            buffer.seek(0)
         return buffer
 
 
@@ -136,10 +182,10 @@ class IncidentReportGenerator(PDFReportGenerator):
         self.start_date = start_date or (timezone.now() - timedelta(days=30)).date()
         self.end_date = end_date or timezone.now().date()
     
-    def generate(self):
+    def generate(self, output=None):
         """Generate the incident report PDF."""
         from incidents.models import Incident
-        from django.db.models import Count
+        from django.db.models import Count, ExpressionWrapper, FloatField, Q
         
         elements = []
         self.create_header(elements)
@@ -152,17 +198,19 @@ class IncidentReportGenerator(PDFReportGenerator):
         elements.append(Spacer(1, 20))
         
         # Get incidents
-        incidents = Incident.objects.filter(
-            created_at__date__gte=self.start_date,
-            created_at__date__lte=self.end_date
-        )
+        incidents = _incidents_created_between(self.start_date, self.end_date)
         
         # Summary section
         elements.append(Paragraph("Executive Summary", self.styles['SectionTitle']))
         
-        total = incidents.count()
-        resolved = incidents.filter(state__in=['resolved', 'closed']).count()
-        sla_breached = incidents.filter(sla_breached=True).count()
+        counts = incidents.aggregate(
+            total=Count('id'),
+            resolved=Count('id', filter=Q(state__in=['resolved', 'closed'])),
+            sla_breached=Count('id', filter=Q(sla_breached=True)),
+        )
+        total = counts['total']
+        resolved = counts['resolved']
+        sla_breached = counts['sla_breached']
         sla_compliance = ((total - sla_breached) / max(total, 1)) * 100
         
         summary_data = [
@@ -180,14 +228,14 @@ class IncidentReportGenerator(PDFReportGenerator):
         elements.append(Paragraph("By Priority", self.styles['SectionTitle']))
         
         priority_data = [['Priority', 'Count', 'Percentage']]
-        for p in incidents.values('priority').annotate(count=Count('id')).order_by('priority'):
-            priority_labels = {1: 'P1 - Critical', 2: 'P2 - High', 3: 'P3 - Medium', 4: 'P4 - Low'}
-            pct = (p['count'] / max(total, 1)) * 100
-            priority_data.append([
-                priority_labels.get(p['priority'], f"P{p['priority']}"),
-                str(p['count']),
-                f'{pct:.1f}%'
-            ])
+        by_priority = incidents.values('priority').annotate(
+            count=Count('id'),
+            pct=ExpressionWrapper(Count('id') * 100.0 / max(total, 1), output_field=FloatField()),
+        ).order_by('priority')
+        priority_data.extend(
+            [_PRIORITY_LABELS.get(priority, f'P{priority}'), str(count), f'{pct:.1f}%']
+            for priority, count, pct in by_priority.values_list('priority', 'count', 'pct')
+        )
         
         elements.append(self.create_table(priority_data, col_widths=[2.5*inch, 1.5*inch, 1.5*inch]))
         elements.append(Spacer(1, 20))
@@ -196,33 +244,44 @@ class IncidentReportGenerator(PDFReportGenerator):
         elements.append(Paragraph("Recent Incidents", self.styles['SectionTitle']))
         
         incident_data = [['Number', 'Title', 'Priority', 'Status', 'Created']]
-        for inc in incidents.order_by('-created_at')[:20]:
-            incident_data.append([
-                inc.number,
-                inc.title[:30] + ('...' if len(inc.title) > 30 else ''),
-                f'P{inc.priority}',
-                inc.get_state_display(),
-                inc.created_at.strftime('%Y-%m-%d %H:%M')
-            ])
+        state_labels = dict(Incident.STATE_CHOICES)
+        rows = incidents.order_by('-created_at').values_list(
+            'number', 'title', 'priority', 'state', 'created_at'
+        )[:20]
+        incident_data.extend(
+            [
+                number,
+                _truncate(title, 30),
+                f'P{priority}',
+                state_labels.get(state, state),
+                created_at.strftime(_DATETIME_FORMAT)
+            ]
+            for number, title, priority, state, created_at in rows
+        )
         
         elements.append(self.create_table(
             incident_data,
             col_widths=[1.2*inch, 2*inch, 0.8*inch, 1*inch, 1.5*inch]
         ))
         
-        return self.generate_pdf(elements)
+        return self.generate_pdf(elements, output)
 
 
 class AssetInventoryReportGenerator(PDFReportGenerator):
     """Generate asset inventory reports."""
     
-    def __init__(self):
+    # Rows in the "Asset Details" table; rows are streamed, so raising it is cheap
+    DETAIL_ROW_LIMIT = 50
+    DETAIL_CHUNK_SIZE = 200
+    
+    def __init__(self, detail_row_limit=None):
         super().__init__(title="Asset Inventory Report")
+        self.detail_row_limit = detail_row_limit or self.DETAIL_ROW_LIMIT
     
-    def generate(self):
+    def generate(self, output=None):
         """Generate the asset inventory report PDF."""
         from cmdb.models import Asset
-        from django.db.models import Count
+        from django.db.models import Count, Q
         
         elements = []
         self.create_header(elements)
@@ -232,13 +291,21 @@ class AssetInventoryReportGenerator(PDFReportGenerator):
         # Summary
         elements.append(Paragraph("Inventory Summary", self.styles['SectionTitle']))
         
+        counts = assets.aggregate(
+            total=Count('id'),
+            in_stock=Count('id', filter=Q(status='in_stock')),
+            assigned=Count('id', filter=Q(status='assigned')),
+            in_repair=Count('id', filter=Q(status='in_repair')),
+            retired=Count('id', filter=Q(status='retired')),
+        )
+        
         summary_data = [
             ['Status', 'Count'],
-            ['Total Assets', str(assets.count())],
-            ['In Stock', str(assets.filter(status='in_stock').count())],
-            ['Assigned', str(assets.filter(status='assigned').count())],
-            ['In Repair', str(assets.filter(status='in_repair').count())],
-            ['Retired', str(assets.filter(status='retired').count())],
+            ['Total Assets', str(counts['total'])],
+            ['In Stock', str(counts['in_stock'])],
+            ['Assigned', str(counts['assigned'])],
+            ['In Repair', str(counts['in_repair'])],
+            ['Retired', str(counts['retired'])],
         ]
         
         elements.append(self.create_table(summary_data, col_widths=[3*inch, 2*inch]))
@@ -248,15 +315,17 @@ class AssetInventoryReportGenerator(PDFReportGenerator):
         elements.append(Paragraph("By Asset Type", self.styles['SectionTitle']))
         
         type_data = [['Type', 'Count', 'Assigned', 'Available']]
-        for at in assets.values('asset_type').annotate(count=Count('id')).order_by('-count'):
-            assigned = assets.filter(asset_type=at['asset_type'], status='assigned').count()
-            available = assets.filter(asset_type=at['asset_type'], status='in_stock').count()
-            type_data.append([
-                at['asset_type'].replace('_', ' ').title(),
-                str(at['count']),
-                str(assigned),
-                str(available)
-            ])
+        by_type = assets.values('asset_type').annotate(
+            count=Count('id'),
+            assigned=Count('id', filter=Q(status='assigned')),
+            available=Count('id', filter=Q(status='in_stock')),
+        ).order_by('-count')
+        type_data.extend(
+            [asset_type.replace('_', ' ').title(), str(count), str(assigned), str(available)]
+            for asset_type, count, assigned, available in by_type.values_list(
+                'asset_type', 'count', 'assigned', 'available'
+            )
+        )
         
         elements.append(self.create_table(type_data))
         elements.append(Spacer(1, 20))
@@ -265,21 +334,28 @@ class AssetInventoryReportGenerator(PDFReportGenerator):
         elements.append(Paragraph("Asset Details", self.styles['SectionTitle']))
         
         asset_data = [['Name', 'Type', 'Serial Number', 'Status', 'Assigned To']]
-        for asset in assets.select_related('assigned_to').order_by('-created_at')[:50]:
-            asset_data.append([
-                asset.name[:25] + ('...' if len(asset.name) > 25 else ''),
-                asset.get_asset_type_display(),
-                asset.serial_number or '-',
-                asset.get_status_display(),
-                asset.assigned_to.username if asset.assigned_to else '-'
-            ])
+        type_labels = dict(Asset.ASSET_TYPE_CHOICES)
+        status_labels = dict(Asset.STATUS_CHOICES)
+        rows = assets.order_by('-created_at').values_list(
+            'name', 'asset_type', 'serial_number', 'status', 'assigned_to__username'
+        )[:self.detail_row_limit]
+        asset_data.extend(
+            [
+                _truncate(name, 25),
+                type_labels.get(asset_type, asset_type),
+                serial or '-',
+                status_labels.get(status, status),
+                username or '-'
+            ]
+            for name, asset_type, serial, status, username in rows.iterator(chunk_size=self.DETAIL_CHUNK_SIZE)
+        )
         
         elements.append(self.create_table(
             asset_data,
             col_widths=[1.5*inch, 1.2*inch, 1.3*inch, 1*inch, 1.2*inch]
         ))
         
-        return self.generate_pdf(elements)
+        return self.generate_pdf(elements, output)
 
 
 class SLAComplianceReportGenerator(PDFReportGenerator):
@@ -290,11 +366,10 @@ class SLAComplianceReportGenerator(PDFReportGenerator):
         self.start_date = start_date or (timezone.now() - timedelta(days=30)).date()
         self.end_date = end_date or timezone.now().date()
     
-    def generate(self):
+    def generate(self, output=None):
         """Generate the SLA compliance report PDF."""
-        from incidents.models import Incident
         from cmdb.models import User
-        from django.db.models import Count, Avg, F
+        from django.db.models import Count, Avg, F, Q
         
         elements = []
         self.create_header(elements)
@@ -305,16 +380,20 @@ class SLAComplianceReportGenerator(PDFReportGenerator):
         ))
         elements.append(Spacer(1, 20))
         
-        incidents = Incident.objects.filter(
-            created_at__date__gte=self.start_date,
-            created_at__date__lte=self.end_date
-        )
+        incidents = _incidents_created_between(self.start_date, self.end_date)
         
         # Overall SLA metrics
         elements.append(Paragraph("Overall SLA Metrics", self.styles['SectionTitle']))
         
-        total = incidents.count()
-        breached = incidents.filter(sla_breached=True).count()
+        priorities = (1, 2, 3, 4)
+        counts = incidents.aggregate(
+            total=Count('id'),
+            breached=Count('id', filter=Q(sla_breached=True)),
+            **{f'p{p}_total': Count('id', filter=Q(priority=p)) for p in priorities},
+            **{f'p{p}_breach': Count('id', filter=Q(priority=p, sla_breached=True)) for p in priorities},
+        )
+        total = counts['total']
+        breached = counts['breached']
         compliance = ((total - breached) / max(total, 1)) * 100
         
         metrics_data = [
@@ -331,13 +410,12 @@ class SLAComplianceReportGenerator(PDFReportGenerator):
         elements.append(Paragraph("SLA by Priority", self.styles['SectionTitle']))
         
         priority_data = [['Priority', 'Total', 'Breached', 'Compliance']]
-        for p in [1, 2, 3, 4]:
-            p_total = incidents.filter(priority=p).count()
-            p_breached = incidents.filter(priority=p, sla_breached=True).count()
+        for p in priorities:
+            p_total = counts[f'p{p}_total']
+            p_breached = counts[f'p{p}_breach']
             p_compliance = ((p_total - p_breached) / max(p_total, 1)) * 100
-            priority_labels = {1: 'P1 - Critical', 2: 'P2 - High', 3: 'P3 - Medium', 4: 'P4 - Low'}
             priority_data.append([
-                priority_labels[p],
+                _PRIORITY_LABELS[p],
                 str(p_total),
                 str(p_breached),
                 f'{p_compliance:.1f}%'
@@ -347,51 +425,90 @@ class SLAComplianceReportGenerator(PDFReportGenerator):
         elements.append(Spacer(1, 20))
         
         # SLA breached incidents
-        breached_incidents = incidents.filter(sla_breached=True).order_by('-created_at')[:20]
+        breached_rows = list(incidents.filter(sla_breached=True).order_by('-created_at').values_list(
+            'number', 'title', 'priority', 'due_date', 'assigned_to__username'
+        )[:20])
         
-        if breached_incidents.exists():
+        if breached_rows:
             elements.append(Paragraph("SLA Breached Incidents", self.styles['SectionTitle']))
             
             breach_data = [['Number', 'Title', 'Priority', 'Due Date', 'Assigned To']]
-            for inc in breached_incidents:
-                breach_data.append([
-                    inc.number,
-                    inc.title[:25] + ('...' if len(inc.title) > 25 else ''),
-                    f'P{inc.priority}',
-                    inc.due_date.strftime('%Y-%m-%d %H:%M') if inc.due_date else '-',
-                    inc.assigned_to.username if inc.assigned_to else '-'
-                ])
+            breach_data.extend(
+                [
+                    number,
+                    _truncate(title, 25),
+                    f'P{priority}',
+                    due_date.strftime(_DATETIME_FORMAT) if due_date else '-',
+                    username or '-'
+                ]
+                for number, title, priority, due_date, username in breached_rows
+            )
             
             elements.append(self.create_table(breach_data))
         
-        return self.generate_pdf(elements)
+        return self.generate_pdf(elements, output)
 
 
-def generate_incident_report_response(start_date=None, end_date=None):
-    """Generate incident report and return HTTP response."""
-    generator = IncidentReportGenerator(start_date, end_date)
-    pdf = generator.generate()
+def cached_report(cache_key, generator):
+    """
+    A report's PDF bytes with their ETag and render time, from cache or
+    rendered and cached on a miss.
+    """
+    cached = cache.get(cache_key)
+    if cached is None:
+        pdf_bytes = generator.generate().getvalue()
+        cached = {
+            'pdf': pdf_bytes,
+            'etag': hashlib.sha1(pdf_bytes).hexdigest(),
+            'generated_at': timezone.now(),
+        }
+        cache.set(cache_key, cached, REPORT_CACHE_TIMEOUT)
+    return cached
+
+
+def _cached_pdf_response(request, cache_key, generator, filename_prefix):
+    """
+    Serve a report from cache, rendering and caching it on a miss.
+    A request whose If-None-Match / If-Modified-Since still matches the
+    cached copy gets a 304 without the PDF.
+    """
+    cached = cached_report(cache_key, generator)
+    etag = quote_etag(cached['etag'])
+    last_modified = int(cached['generated_at'].timestamp())
     
-    response = HttpResponse(pdf.read(), content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="incident_report_{timezone.now().strftime("%Y%m%d")}.pdf"'
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(cached['pdf'], content_type='application/pdf')
+        response['Content-Disposition'] = f'attachment; filename="{filename_prefix}_{timezone.now().strftime("%Y%m%d")}.pdf"'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
     return response
 
 
-def generate_asset_report_response():
+def incident_report_cache_key(generator):
+    return f'report:incident:{generator.start_date}:{generator.end_date}'
+
+
+def generate_incident_report_response(request, start_date=None, end_date=None):
+    """Generate incident report and return HTTP response."""
+    generator = IncidentReportGenerator(start_date, end_date)
+    return _cached_pdf_response(request, incident_report_cache_key(generator), generator, 'incident_report')
+
+
+def generate_asset_report_response(request):
     """Generate asset report and return HTTP response."""
-    generator = AssetInventoryReportGenerator()
-    pdf = generator.generate()
+    from cmdb.models import Asset
+    from django.db.models import Count, Max
     
-    response = HttpResponse(pdf.read(), content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="asset_inventory_{timezone.now().strftime("%Y%m%d")}.pdf"'
-    return response
+    # Key on the inventory state so any asset change renders a fresh report
+    stamp = Asset.objects.order_by().aggregate(count=Count('id'), updated=Max('updated_at'))
+    updated = stamp['updated'].timestamp() if stamp['updated'] else 0
+    cache_key = f"report:asset:{stamp['count']}:{updated}"
+    return _cached_pdf_response(request, cache_key, AssetInventoryReportGenerator(), 'asset_inventory')
 
 
-def generate_sla_report_response(start_date=None, end_date=None):
+def generate_sla_report_response(request, start_date=None, end_date=None):
     """Generate SLA report and return HTTP response."""
     generator = SLAComplianceReportGenerator(start_date, end_date)
-    pdf = generator.generate()
-    
-    response = HttpResponse(pdf.read(), content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="sla_compliance_{timezone.now().strftime("%Y%m%d")}.pdf"'
-    return response
+    cache_key = f'report:sla:{generator.start_date}:{generator.end_date}'
+    return _cached_pdf_response(request, cache_key, generator, 'sla_compliance')
@@ -11,15 +11,148 @@ Celery tasks for report generation:
 from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.utils import timezone
-from django.db.models import Count, Avg, Q, F
-from django.db.models.functions import TruncDate
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.db.models import Count, Q, F, Sum, FloatField
+from django.db.models.functions import Cast, NullIf
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
-from datetime import timedelta
-import json
+from datetime import date, timedelta
+import orjson
+import uuid
 
 logger = get_task_logger(__name__)
 
+# Created/resolved counts for a finished day no longer change, so they can
+# be kept for as long as any weekly or monthly report might want them. SLA
+# breaches are not cached: the SLA checker flags incidents after the fact,
+# so those are always summed from the rollup when a report runs.
+DAILY_COUNTS_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+
+# When the incident daily rollup was last rebuilt
+INCIDENT_STATS_BUILT_KEY = 'incident_daily_stats:built_at'
+
+# Marks a day's summary as emailed, so a re-run of the task doesn't send
+# it twice
+DAILY_SUMMARY_SENT_TIMEOUT = 60 * 60 * 24 * 2
+
+
+def _incident_rollup(start, end):
+    """IncidentDailyStat rows for the inclusive date range."""
+    from .models import IncidentDailyStat
+    
+    return IncidentDailyStat.objects.filter(day__gte=start, day__lte=end).order_by()
+
+
+def _incident_totals(start, end):
+    """Created / breached / resolved totals summed from the daily rollup."""
+    totals = _incident_rollup(start, end).aggregate(
+        created=Sum('created'),
+        sla_breached=Sum('sla_breached'),
+        resolved=Sum('resolved'),
+        resolution_time=Sum('resolution_time'),
+    )
+    for key in ('created', 'sla_breached', 'resolved'):
+        totals[key] = totals[key] or 0
+    return totals
+
+
+def _rebuild_incident_daily_stats():
+    """Rebuild the rollup and record when it was built."""
+    from .models import IncidentDailyStat
+    
+    # Stamped with the start time: incidents changed during the rebuild
+    # may be missed, so the rollup only covers up to this point
+    built_at = timezone.now()
+    rows = IncidentDailyStat.rebuild()
+    cache.set(INCIDENT_STATS_BUILT_KEY, built_at, timeout=None)
+    return rows
+
+
+def _ensure_rollup_covers(day):
+    """
+    Rebuild the rollup now unless it was built after day ended.
+    The summary tasks are scheduled after refresh_incident_daily_stats but
+    don't depend on it having run (or succeeded) first.
+    """
+    built_at = cache.get(INCIDENT_STATS_BUILT_KEY)
+    if built_at is None or timezone.localdate(built_at) <= day:
+        logger.info(f"Incident daily stats do not cover {day}, rebuilding")
+        _rebuild_incident_daily_stats()
+
+
+@shared_task
+def refresh_incident_daily_stats():
+    """
+    Rebuild the incident daily rollup.
+    Runs at 5:30 AM via Celery Beat, ahead of the summary reports.
+    """
+    try:
+        rows = _rebuild_incident_daily_stats()
+        logger.info(f"Incident daily stats refreshed: {rows} rows")
+        return {'rows': rows}
+        
+    except Exception as exc:
+        logger.error(f"Failed to refresh incident daily stats: {exc}")
+        raise
+
+
+def _daily_counts_cache_key(day):
+    return f'daily_counts:{day.isoformat()}'
+
+
+def _daily_summary_sent_key(day):
+    return f'daily_summary_sent:{day.isoformat()}'
+
+
+def _build_daily_counts(day):
+    """Incident and request created/resolved counts for one (finished) day."""
+    from service_requests.models import ServiceRequest
+    
+    # Incident statistics
+    incident_totals = _incident_totals(day, day)
+    
+    # Request statistics
+    requests_created = ServiceRequest.objects.filter(
+        created_at__date=day
+    ).count()
+    
+    requests_completed = ServiceRequest.objects.filter(
+        completed_at__date=day
+    ).count()
+    
+    return {
+        'date': str(day),
+        'incidents': {
+            'created': incident_totals['created'],
+            'resolved': incident_totals['resolved'],
+        },
+        'requests': {
+            'created': requests_created,
+            'completed': requests_completed
+        }
+    }
+
+
+def _daily_counts(days):
+    """
+    Cached daily counts for the given days, in order.
+    One cache round-trip for all of them; any misses are computed and
+    stored together.
+    """
+    keys = {day: _daily_counts_cache_key(day) for day in days}
+    cached = cache.get_many(keys.values())
+    
+    missing = {
+        keys[day]: _build_daily_counts(day)
+        for day in days
+        if keys[day] not in cached
+    }
+    if missing:
+        cache.set_many(missing, timeout=DAILY_COUNTS_CACHE_TIMEOUT)
+        cached.update(missing)
+    
+    return [cached[keys[day]] for day in days]
+
 
 @shared_task
 def generate_daily_summary():
@@ -27,58 +160,35 @@ def generate_daily_summary():
     Generate daily summary report.
     Runs at 6 AM via Celery Beat.
     """
-    from incidents.models import Incident
-    from service_requests.models import ServiceRequest
-    
     try:
         today = timezone.now().date()
         yesterday = today - timedelta(days=1)
         
-        # Incident statistics
-        incidents_created = Incident.objects.filter(
-            created_at__date=yesterday
-        ).count()
-        
-        incidents_resolved = Incident.objects.filter(
-            resolved_at__date=yesterday
-        ).count()
-        
-        sla_breaches = Incident.objects.filter(
-            created_at__date=yesterday,
-            sla_breached=True
-        ).count()
+        sent_key = _daily_summary_sent_key(yesterday)
+        summary = cache.get(sent_key)
+        if summary is not None:
+            # Already generated and emailed for this day
+            return summary
         
-        # Request statistics
-        requests_created = ServiceRequest.objects.filter(
-            created_at__date=yesterday
-        ).count()
+        _ensure_rollup_covers(yesterday)
         
-        requests_completed = ServiceRequest.objects.filter(
-            completed_at__date=yesterday
-        ).count()
+        summary = _daily_counts([yesterday])[0]
+        incidents_created = summary['incidents']['created']
+        sla_breaches = _incident_totals(yesterday, yesterday)['sla_breached']
         
         # Calculate SLA compliance
         total_incidents = incidents_created or 1  # Avoid division by zero
         sla_compliance = ((total_incidents - sla_breaches) / total_incidents) * 100
         
-        summary = {
-            'date': str(yesterday),
-            'incidents': {
-                'created': incidents_created,
-                'resolved': incidents_resolved,
-                'sla_breaches': sla_breaches,
-                'sla_compliance': round(sla_compliance, 2)
-            },
-            'requests': {
-                'created': requests_created,
-                'completed': requests_completed
-            }
-        }
+        summary['incidents']['sla_breaches'] = sla_breaches
+        summary['incidents']['sla_compliance'] = round(sla_compliance, 2)
         
         logger.info(f"Daily summary generated for {yesterday}: {summary}")
         
-        # Send email to admins
+        # Send email to admins; only once it is queued is the day marked
+        # as sent, so a failed run is retried in full
         send_summary_email.delay('daily', summary)
+        cache.set(sent_key, summary, timeout=DAILY_SUMMARY_SENT_TIMEOUT)
         
         return summary
         
@@ -93,76 +203,64 @@ def generate_weekly_report():
     Generate weekly report.
     Runs every Monday at 7 AM via Celery Beat.
     """
-    from incidents.models import Incident
-    from service_requests.models import ServiceRequest
     from cmdb.models import User
     
     try:
         today = timezone.now().date()
         week_start = today - timedelta(days=today.weekday() + 7)  # Last Monday
         week_end = week_start + timedelta(days=6)  # Last Sunday
+        _ensure_rollup_covers(week_end)
+        
+        week = _incident_rollup(week_start, week_end)
+        
+        # Daily counts are normally cached by generate_daily_summary
+        dailies = _daily_counts([week_start + timedelta(days=offset) for offset in range(7)])
         
         # Incident trends by day
-        incidents_by_day = Incident.objects.filter(
-            created_at__date__gte=week_start,
-            created_at__date__lte=week_end
-        ).annotate(
-            date=TruncDate('created_at')
-        ).values('date').annotate(
-            count=Count('id')
-        ).order_by('date')
+        incidents_by_day = [
+            {'date': date.fromisoformat(daily['date']), 'count': daily['incidents']['created']}
+            for daily in dailies
+            if daily['incidents']['created']
+        ]
         
         # Incidents by priority
-        incidents_by_priority = Incident.objects.filter(
-            created_at__date__gte=week_start,
-            created_at__date__lte=week_end
-        ).values('priority').annotate(
-            count=Count('id')
-        ).order_by('priority')
+        incidents_by_priority = week.values('priority').annotate(
+            count=Sum('created')
+        ).filter(count__gt=0).order_by('priority')
         
         # Top performers (most resolved incidents)
-        top_performers = User.objects.filter(
-            assigned_incidents__resolved_at__date__gte=week_start,
-            assigned_incidents__resolved_at__date__lte=week_end
+        top_performers = week.filter(
+            assigned_to__role__in=User.SUPPORT_ROLES
+        ).values(
+            'assigned_to__username'
         ).annotate(
-            resolved_count=Count('assigned_incidents')
-        ).order_by('-resolved_count')[:5]
+            resolved_count=Sum('resolved')
+        ).filter(resolved_count__gt=0).order_by('-resolved_count')[:5]
         
         # SLA compliance rate
-        total_incidents = Incident.objects.filter(
-            created_at__date__gte=week_start,
-            created_at__date__lte=week_end
-        ).count()
-        
-        sla_breaches = Incident.objects.filter(
-            created_at__date__gte=week_start,
-            created_at__date__lte=week_end,
-            sla_breached=True
-        ).count()
+        total_incidents = sum(daily['incidents']['created'] for daily in dailies)
+        sla_breaches = _incident_totals(week_start, week_end)['sla_breached']
         
         sla_compliance = ((total_incidents - sla_breaches) / max(total_incidents, 1)) * 100
         
-        # Average resolution time
-        avg_resolution = Incident.objects.filter(
-            resolved_at__date__gte=week_start,
-            resolved_at__date__lte=week_end
-        ).annotate(
-            resolution_time=F('resolved_at') - F('created_at')
-        ).aggregate(
-            avg_time=Avg('resolution_time')
-        )['avg_time']
+        # Average resolution time in hours, computed by the database.
+        # DurationField is stored as a microsecond count on MySQL, so the
+        # raw sum divides straight into hours without building a timedelta.
+        avg_resolution_hours = week.aggregate(
+            hours=Cast(Sum('resolution_time'), FloatField()) / NullIf(Sum('resolved'), 0) / 3600000000
+        )['hours']
         
         report = {
             'week': f"{week_start} to {week_end}",
             'total_incidents': total_incidents,
             'sla_breaches': sla_breaches,
             'sla_compliance': round(sla_compliance, 2),
-            'avg_resolution_hours': avg_resolution.total_seconds() / 3600 if avg_resolution else None,
-            'incidents_by_day': list(incidents_by_day),
+            'avg_resolution_hours': avg_resolution_hours,
+            'incidents_by_day': incidents_by_day,
             'incidents_by_priority': list(incidents_by_priority),
             'top_performers': [
-                {'username': u.username, 'resolved': u.resolved_count}
-                for u in top_performers
+                {'username': row['assigned_to__username'], 'resolved': row['resolved_count']}
+                for row in top_performers
             ]
         }
         
@@ -184,7 +282,6 @@ def generate_monthly_summary():
     Generate monthly summary report.
     Runs on the 1st of each month at 8 AM.
     """
-    from incidents.models import Incident
     from service_requests.models import ServiceRequest
     from cmdb.models import Asset
     
@@ -194,32 +291,32 @@ def generate_monthly_summary():
         first_of_this_month = today.replace(day=1)
         last_of_prev_month = first_of_this_month - timedelta(days=1)
         first_of_prev_month = last_of_prev_month.replace(day=1)
+        _ensure_rollup_covers(last_of_prev_month)
         
-        # Summary statistics
-        incidents_total = Incident.objects.filter(
-            created_at__date__gte=first_of_prev_month,
-            created_at__date__lte=last_of_prev_month
-        ).count()
-        
-        incidents_resolved = Incident.objects.filter(
-            resolved_at__date__gte=first_of_prev_month,
-            resolved_at__date__lte=last_of_prev_month
-        ).count()
+        # Summary statistics: incidents from the daily rollup, requests in
+        # one filtered-COUNT query
+        created = Q(created_at__date__gte=first_of_prev_month, created_at__date__lte=last_of_prev_month)
+        completed = Q(completed_at__date__gte=first_of_prev_month, completed_at__date__lte=last_of_prev_month)
         
-        requests_total = ServiceRequest.objects.filter(
-            created_at__date__gte=first_of_prev_month,
-            created_at__date__lte=last_of_prev_month
-        ).count()
-        
-        requests_completed = ServiceRequest.objects.filter(
-            completed_at__date__gte=first_of_prev_month,
-            completed_at__date__lte=last_of_prev_month
-        ).count()
+        incident_stats = _incident_totals(first_of_prev_month, last_of_prev_month)
+        request_stats = ServiceRequest.objects.filter(created | completed).aggregate(
+            total=Count('id', filter=created),
+            completed=Count('id', filter=completed),
+        )
+        incidents_total = incident_stats['created']
+        incidents_resolved = incident_stats['resolved']
+        requests_total = request_stats['total']
+        requests_completed = request_stats['completed']
         
         # Asset statistics
-        assets_total = Asset.objects.count()
-        assets_assigned = Asset.objects.filter(status='assigned').count()
-        assets_in_stock = Asset.objects.filter(status='in_stock').count()
+        asset_stats = Asset.objects.aggregate(
+            total=Count('id'),
+            assigned=Count('id', filter=Q(status='assigned')),
+            in_stock=Count('id', filter=Q(status='in_stock')),
+        )
+        assets_total = asset_stats['total']
+        assets_assigned = asset_stats['assigned']
+        assets_in_stock = asset_stats['in_stock']
         
         report = {
             'month': first_of_prev_month.strftime('%B %Y'),
@@ -257,58 +354,47 @@ def update_staff_performance():
     Runs every hour via Celery Beat.
     """
     from cmdb.models import User
-    from incidents.models import Incident
-    from service_requests.models import ServiceRequest
     
     try:
         now = timezone.now()
         thirty_days_ago = now - timedelta(days=30)
         
-        # Get all support staff
-        support_staff = User.objects.filter(
-            role__in=['it_support', 'technician', 'admin']
-        )
+        resolved = Q(assigned_incidents__resolved_at__gte=thirty_days_ago)
         
-        scores = []
-        
-        for user in support_staff:
-            # Count resolved incidents
-            resolved_incidents = Incident.objects.filter(
-                assigned_to=user,
-                resolved_at__gte=thirty_days_ago
-            ).count()
-            
-            # Count SLA compliant incidents
-            sla_compliant = Incident.objects.filter(
-                assigned_to=user,
-                resolved_at__gte=thirty_days_ago,
-                sla_breached=False
-            ).count()
-            
-            # Count completed requests
-            completed_requests = ServiceRequest.objects.filter(
-                assigned_to=user,
-                completed_at__gte=thirty_days_ago
-            ).count()
-            
+        # One query for all support staff; distinct because both reverse
+        # joins multiply each other's rows
+        support_staff = User.objects.filter(
+            role__in=User.SUPPORT_ROLES
+        ).annotate(
+            resolved_incidents=Count('assigned_incidents', filter=resolved, distinct=True),
+            sla_compliant=Count(
+                'assigned_incidents',
+                filter=resolved & Q(assigned_incidents__sla_breached=False),
+                distinct=True
+            ),
+            completed_requests=Count(
+                'assigned_requests',
+                filter=Q(assigned_requests__completed_at__gte=thirty_days_ago),
+                distinct=True
+            ),
+        ).annotate(
             # Calculate score (weighted)
-            score = (
-                resolved_incidents * 10 +
-                sla_compliant * 5 +
-                completed_requests * 8
+            score=F('resolved_incidents') * 10 + F('sla_compliant') * 5 + F('completed_requests') * 8
+        ).order_by('-score')
+        
+        scores = [
+            {
+                'user_id': row['pk'],
+                'username': row['username'],
+                'resolved_incidents': row['resolved_incidents'],
+                'sla_compliant': row['sla_compliant'],
+                'completed_requests': row['completed_requests'],
+                'score': row['score']
+            }
+            for row in support_staff.values(
+                'pk', 'username', 'resolved_incidents', 'sla_compliant', 'completed_requests', 'score'
             )
-            
-            scores.append({
-                'user_id': user.pk,
-                'username': user.username,
-                'resolved_incidents': resolved_incidents,
-                'sla_compliant': sla_compliant,
-                'completed_requests': completed_requests,
-                'score': score
-            })
-        
-        # Sort by score
-        scores.sort(key=lambda x: x['score'], reverse=True)
+        ]
         
         logger.info(f"Updated performance scores for {len(scores)} staff members")
         return {'staff_count': len(scores), 'top_3': scores[:3]}
@@ -327,42 +413,47 @@ def send_summary_email(self, report_type, data):
     
     try:
         # Get admin emails
-        admins = User.objects.filter(
+        recipient_list = list(User.objects.filter(
             role__in=['admin', 'manager'],
             is_active=True,
             email__isnull=False
-        ).exclude(email='')
+        ).exclude(email='').values_list('email', flat=True))
         
-        if not admins.exists():
+        if not recipient_list:
             logger.warning("No admin emails found for summary report")
             return {'status': 'no_recipients'}
         
-        recipient_list = list(admins.values_list('email', flat=True))
-        
-        subject = f"[PyService] {report_type.title()} Report - {timezone.now().strftime('%Y-%m-%d')}"
+        now = timezone.now()
+        subject = f"[PyService] {report_type.title()} Report - {now.strftime('%Y-%m-%d')}"
         
-        # Format the data nicely
+        # Keep the body short; the report data travels as a JSON attachment
         message = f"""
 PyService {report_type.title()} Report
 {'=' * 40}
 
-Generated: {timezone.now().strftime('%Y-%m-%d %H:%M')}
+Generated: {now.strftime('%Y-%m-%d %H:%M')}
 
-Report Data:
-{json.dumps(data, indent=2, default=str)}
+The report data is attached as JSON.
 
 ---
 PyService Mini-ITSM Platform
 Automated Report
         """
         
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=recipient_list,
-            fail_silently=False,
-        )
+        with get_connection(fail_silently=False) as connection:
+            email = EmailMessage(
+                subject=subject,
+                body=message,
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=recipient_list,
+                connection=connection,
+            )
+            email.attach(
+                f"{report_type}_report_{now.strftime('%Y%m%d')}.json",
+                orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str),
+                'application/json'
+            )
+            email.send()
         
         logger.info(f"{report_type.title()} report email sent to {len(recipient_list)} recipients")
         return {'status': 'sent', 'recipients': len(recipient_list)}
@@ -372,33 +463,45 @@ Automated Report
         raise self.retry(exc=exc, countdown=300)
 
 
-@shared_task
-def export_incident_report_to_pdf(start_date, end_date, user_id):
+@shared_task(bind=True, acks_late=True)
+def export_incident_report_to_pdf(self, start_date, end_date, user_id):
     """
     Generate and export incident report as PDF.
-    This task is triggered manually by users.
+    This task is triggered manually by users; the file is written to
+    default storage and the user is notified with a download link.
+    Acknowledged late so an export lost to a worker restart is redelivered
+    instead of leaving the user polling forever.
     """
-    # PDF generation will be handled by the pdf_generator module
-    # This task queues the job and notifies user when ready
     from notifications.models import Notification
     from cmdb.models import User
+    from django.core.files.base import ContentFile
+    from django.core.files.storage import default_storage
+    from django.urls import reverse
+    from django.utils.dateparse import parse_date
+    from .pdf_generator import IncidentReportGenerator, cached_report, incident_report_cache_key
     
     try:
         user = User.objects.get(pk=user_id)
         
-        # TODO: Implement PDF generation
-        # pdf_path = generate_incident_pdf(start_date, end_date)
+        generator = IncidentReportGenerator(
+            parse_date(start_date) if start_date else None,
+            parse_date(end_date) if end_date else None,
+        )
+        # Shares the report cache, so exporting the same range again
+        # within REPORT_CACHE_TIMEOUT skips rendering
+        pdf = cached_report(incident_report_cache_key(generator), generator)['pdf']
+        path = default_storage.save(f'reports/{uuid.uuid4().hex}.pdf', ContentFile(pdf))
         
         Notification.create_notification(
             user=user,
             notification_type='general',
             title='Report Ready',
-            message=f'Your incident report for {start_date} to {end_date} is ready for download.',
-            link='/reports/downloads/'
+            message=f'Your incident report for {generator.start_date} to {generator.end_date} is ready for download.',
+            link=reverse('report_download', args=[self.request.id])
         )
         
         logger.info(f"PDF report generated for user {user.username}")
-        return {'status': 'completed'}
+        return {'status': 'completed', 'path': path}
         
     except User.DoesNotExist:
         logger.error(f"User {user_id} not found")
@@ -406,3 +509,35 @@ def export_incident_report_to_pdf(start_date, end_date, user_id):
     except Exception as exc:
         logger.error(f"Failed to generate PDF report: {exc}")
         raise
+
+
+@shared_task
+def cleanup_report_exports():
+    """
+    Delete exported PDFs nobody can download any more.
+    Runs hourly via Celery Beat; a file is kept as long as the job key
+    that authorises its download (REPORT_JOB_TIMEOUT).
+    """
+    from django.core.files.storage import default_storage
+    from .views import REPORT_JOB_TIMEOUT
+    
+    try:
+        cutoff = timezone.now() - timedelta(seconds=REPORT_JOB_TIMEOUT)
+        _, files = default_storage.listdir('reports')
+        
+        deleted = 0
+        for name in files:
+            path = f'reports/{name}'
+            if name.endswith('.pdf') and default_storage.get_modified_time(path) < cutoff:
+                default_storage.delete(path)
+                deleted += 1
+        
+        logger.info(f"Deleted {deleted} expired report exports")
+        return {'deleted': deleted}
+        
+    except FileNotFoundError:
+        # Nothing exported yet
+        return {'deleted': 0}
+    except Exception as exc:
+        logger.error(f"Failed to clean up report exports: {exc}")
+        raise
@@ -0,0 +1,53 @@
+"""
+Reports Module Tests
+PyService Mini-ITSM Platform
+
+Tests for the cached PDF report downloads
+"""
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+class TestCachedPDFReports:
+    """Test PDF reports are served from cache with conditional GET support."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty report cache."""
+        cache.clear()
+    
+    def test_sla_report_not_modified(self, client, manager):
+        """Test a matching If-None-Match gets 304 without the PDF."""
+        client.force_login(manager)
+        url = reverse('export_sla_pdf')
+        
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/pdf'
+        assert response.content.startswith(b'%PDF')
+        
+        response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+        assert response.content == b''
+        
+        response = client.get(url, HTTP_IF_NONE_MATCH='"stale"')
+        assert response.status_code == 200
+    
+    def test_asset_report_not_modified_since(self, client, manager, laptop):
+        """Test If-Modified-Since at the cached render time gets 304."""
+        client.force_login(manager)
+        url = reverse('export_assets_pdf')
+        
+        response = client.get(url)
+        assert response.status_code == 200
+        
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        assert response.status_code == 304
+    
+    def test_staff_cannot_download(self, client, staff_user):
+        """Test users without a reporting role are refused."""
+        client.force_login(staff_user)
+        assert client.get(reverse('export_sla_pdf')).status_code == 403
@@ -10,5 +10,10 @@ urlpatterns = [
     path('export/incidents/', views.export_incidents_csv, name='export_incidents'),
     path('export/requests/', views.export_requests_csv, name='export_requests'),
     path('export/assets/', views.export_assets_csv, name='export_assets'),
+    path('export/incidents/pdf/', views.export_incidents_pdf, name='export_incidents_pdf'),
+    path('export/assets/pdf/', views.export_assets_pdf, name='export_assets_pdf'),
+    path('export/sla/pdf/', views.export_sla_pdf, name='export_sla_pdf'),
+    path('status/<str:task_id>/', views.report_status, name='report_status'),
+    path('download/<str:task_id>/', views.report_download, name='report_download'),
     path('monthly/', views.monthly_summary, name='monthly_summary'),
 ]
@@ -5,12 +5,17 @@ Generate PDF and Excel reports
 """
 
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.http import require_POST
+from django.db.models import Count, Q
 from django.utils import timezone
 from datetime import datetime, timedelta
+from functools import wraps
+from dateutil.relativedelta import relativedelta
 import csv
 import io
+import itertools
 
 from incidents.models import Incident
 from service_requests.models import ServiceRequest
@@ -29,110 +34,158 @@ def reports_dashboard(request):
     
     now = timezone.now()
     
+    # Same-table counts share one filtered-COUNT query per model
+    incident_counts = Incident.objects.aggregate(
+        total=Count('id'),
+        open=Count('id', filter=~Q(state__in=['resolved', 'closed'])),
+    )
+    request_counts = ServiceRequest.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(state='awaiting_approval')),
+    )
+    session_counts = RemoteSupportSession.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+    )
+    
     # Basic stats for the report page
     context = {
-        'total_incidents': Incident.objects.count(),
-        'open_incidents': Incident.objects.exclude(state__in=['resolved', 'closed']).count(),
-        'total_requests': ServiceRequest.objects.count(),
-        'pending_requests': ServiceRequest.objects.filter(state='awaiting_approval').count(),
+        'total_incidents': incident_counts['total'],
+        'open_incidents': incident_counts['open'],
+        'total_requests': request_counts['total'],
+        'pending_requests': request_counts['pending'],
         'total_assets': Asset.objects.count(),
         'total_users': User.objects.count(),
         'total_departments': Department.objects.count(),
-        'total_sessions': RemoteSupportSession.objects.count(),
-        'pending_sessions': RemoteSupportSession.objects.filter(status='pending').count(),
+        'total_sessions': session_counts['total'],
+        'pending_sessions': session_counts['pending'],
     }
     
     return render(request, 'reports/dashboard.html', context)
 
 
-@login_required
+def export_role_required(view_func):
+    """Login plus the admin/manager role check shared by the export views."""
+    @login_required
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if request.user.role not in ('admin', 'manager'):
+            return HttpResponse('Unauthorized', status=403)
+        return view_func(request, *args, **kwargs)
+    return wrapper
+
+
+# Rows fetched per database round-trip while streaming CSV exports
+CSV_EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """Pseudo-buffer for csv.writer: write() hands the line back instead of storing it."""
+    
+    def write(self, value):
+        return value
+
+
+def _stream_csv(filename, header, rows):
+    """Stream a CSV download row by row instead of building it in memory."""
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in itertools.chain([header], rows)),
+        content_type='text/csv'
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}_{timezone.now().strftime("%Y%m%d")}.csv"'
+    return response
+
+
+def _choice_labels(model, field_name):
+    """value -> label map for a choices field, built once per export."""
+    return dict(model._meta.get_field(field_name).choices)
+
+
+@export_role_required
 def export_incidents_csv(request):
     """Export incidents to CSV."""
-    if request.user.role not in ['admin', 'manager']:
-        return HttpResponse('Unauthorized', status=403)
+    header = ['Number', 'Title', 'State', 'Priority', 'Impact', 'Urgency', 
+              'Caller', 'Assigned To', 'Created At', 'Due Date', 'SLA Breached']
     
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="incidents_{timezone.now().strftime("%Y%m%d")}.csv"'
+    state_labels = _choice_labels(Incident, 'state')
+    priority_labels = _choice_labels(Incident, 'priority')
+    impact_labels = _choice_labels(Incident, 'impact')
+    urgency_labels = _choice_labels(Incident, 'urgency')
     
-    writer = csv.writer(response)
-    writer.writerow(['Number', 'Title', 'State', 'Priority', 'Impact', 'Urgency', 
-                     'Caller', 'Assigned To', 'Created At', 'Due Date', 'SLA Breached'])
-    
-    incidents = Incident.objects.all().order_by('-created_at')
-    for inc in incidents:
-        writer.writerow([
+    incidents = Incident.objects.select_related('caller', 'assigned_to').order_by('-created_at')
+    rows = (
+        [
             inc.number,
             inc.title,
-            inc.get_state_display(),
-            inc.get_priority_display(),
-            inc.get_impact_display(),
-            inc.get_urgency_display(),
+            state_labels.get(inc.state, inc.state),
+            priority_labels.get(inc.priority, inc.priority),
+            impact_labels.get(inc.impact, inc.impact),
+            urgency_labels.get(inc.urgency, inc.urgency),
             str(inc.caller) if inc.caller else '',
             str(inc.assigned_to) if inc.assigned_to else '',
             inc.created_at.strftime('%Y-%m-%d %H:%M'),
             inc.due_date.strftime('%Y-%m-%d %H:%M') if inc.due_date else '',
             'Yes' if inc.sla_breached else 'No',
-        ])
+        ]
+        for inc in incidents.iterator(chunk_size=CSV_EXPORT_CHUNK_SIZE)
+    )
     
-    return response
+    return _stream_csv('incidents', header, rows)
 
 
-@login_required
+@export_role_required
 def export_requests_csv(request):
     """Export service requests to CSV."""
-    if request.user.role not in ['admin', 'manager']:
-        return HttpResponse('Unauthorized', status=403)
+    header = ['Number', 'Title', 'State', 'Request Type', 'Requester', 
+              'Assigned To', 'Created At', 'Approved At']
     
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="requests_{timezone.now().strftime("%Y%m%d")}.csv"'
+    state_labels = _choice_labels(ServiceRequest, 'state')
+    type_labels = _choice_labels(ServiceRequest, 'request_type')
     
-    writer = csv.writer(response)
-    writer.writerow(['Number', 'Title', 'State', 'Request Type', 'Requester', 
-                     'Assigned To', 'Created At', 'Approved At'])
-    
-    requests = ServiceRequest.objects.all().order_by('-created_at')
-    for req in requests:
-        writer.writerow([
+    requests = ServiceRequest.objects.select_related('requester', 'assigned_to').order_by('-created_at')
+    rows = (
+        [
             req.number,
             req.title,
-            req.get_state_display(),
-            req.get_request_type_display() if hasattr(req, 'get_request_type_display') else '',
+            state_labels.get(req.state, req.state),
+            type_labels.get(req.request_type, req.request_type),
             str(req.requester) if req.requester else '',
             str(req.assigned_to) if req.assigned_to else '',
             req.created_at.strftime('%Y-%m-%d %H:%M'),
             req.approved_at.strftime('%Y-%m-%d %H:%M') if hasattr(req, 'approved_at') and req.approved_at else '',
-        ])
+        ]
+        for req in requests.iterator(chunk_size=CSV_EXPORT_CHUNK_SIZE)
+    )
     
-    return response
+    return _stream_csv('requests', header, rows)
 
 
-@login_required
+@export_role_required
 def export_assets_csv(request):
     """Export assets to CSV."""
-    if request.user.role not in ['admin', 'manager']:
-        return HttpResponse('Unauthorized', status=403)
-    
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="assets_{timezone.now().strftime("%Y%m%d")}.csv"'
+    header = ['Name', 'Type', 'Status', 'Serial Number', 'Assigned To', 
+              'Location', 'Purchase Date', 'Purchase Cost']
     
-    writer = csv.writer(response)
-    writer.writerow(['Name', 'Type', 'Status', 'Serial Number', 'Assigned To', 
-                     'Location', 'Purchase Date', 'Purchase Cost'])
+    type_labels = _choice_labels(Asset, 'asset_type')
+    status_labels = _choice_labels(Asset, 'status')
     
-    assets = Asset.objects.all().order_by('-created_at')
-    for asset in assets:
-        writer.writerow([
+    assets = Asset.objects.select_related('assigned_to').order_by('-created_at')
+    rows = (
+        [
             asset.name,
-            asset.get_asset_type_display(),
-            asset.get_status_display(),
+            type_labels.get(asset.asset_type, asset.asset_type),
+            status_labels.get(asset.status, asset.status),
             asset.serial_number or '',
             str(asset.assigned_to) if asset.assigned_to else '',
             asset.location or '',
             asset.purchase_date.strftime('%Y-%m-%d') if asset.purchase_date else '',
             str(asset.purchase_cost) if asset.purchase_cost else '',
-        ])
+        ]
+        for asset in assets.iterator(chunk_size=CSV_EXPORT_CHUNK_SIZE)
+    )
     
-    return response
+    return _stream_csv('assets', header, rows)
 
 
 @login_required
@@ -150,59 +203,43 @@ def monthly_summary(request):
     try:
         year, month = map(int, month_str.split('-'))
         month_start = datetime(year, month, 1, tzinfo=timezone.get_current_timezone())
-    except:
-        month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    
-    # Calculate month end
-    if month_start.month == 12:
-        month_end = month_start.replace(year=month_start.year + 1, month=1)
-    else:
-        month_end = month_start.replace(month=month_start.month + 1)
-    
-    # Get stats for the month
-    incidents_created = Incident.objects.filter(
-        created_at__gte=month_start,
-        created_at__lt=month_end
-    ).count()
-    
-    incidents_resolved = Incident.objects.filter(
-        state__in=['resolved', 'closed'],
-        updated_at__gte=month_start,
-        updated_at__lt=month_end
-    ).count()
-    
-    requests_created = ServiceRequest.objects.filter(
-        created_at__gte=month_start,
-        created_at__lt=month_end
-    ).count()
-    
-    requests_completed = ServiceRequest.objects.filter(
-        state__in=['completed', 'fulfilled'],
-        updated_at__gte=month_start,
-        updated_at__lt=month_end
-    ).count()
-    
-    sessions_created = RemoteSupportSession.objects.filter(
-        created_at__gte=month_start,
-        created_at__lt=month_end
-    ).count()
-
-    sessions_completed = RemoteSupportSession.objects.filter(
-        status='completed',
-        completed_at__gte=month_start,
-        completed_at__lt=month_end
-    ).count()
+    except ValueError:
+        month_start = timezone.localtime().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    
+    month_end = month_start + relativedelta(months=1)
+    
+    # Get stats for the month: one filtered-COUNT query per table.
+    # Rows qualify by either window, then each count applies its own.
+    created_in_month = Q(created_at__gte=month_start, created_at__lt=month_end)
+    updated_in_month = Q(updated_at__gte=month_start, updated_at__lt=month_end)
+    
+    incident_stats = Incident.objects.filter(created_in_month | updated_in_month).aggregate(
+        created=Count('id', filter=created_in_month),
+        resolved=Count('id', filter=updated_in_month & Q(state__in=['resolved', 'closed'])),
+        sla_breached=Count('id', filter=created_in_month & Q(sla_breached=True)),
+    )
+    
+    request_stats = ServiceRequest.objects.filter(created_in_month | updated_in_month).aggregate(
+        created=Count('id', filter=created_in_month),
+        completed=Count('id', filter=updated_in_month & Q(state__in=['completed', 'fulfilled'])),
+    )
+    
+    completed_in_month = Q(status='completed', completed_at__gte=month_start, completed_at__lt=month_end)
+    session_stats = RemoteSupportSession.objects.filter(created_in_month | completed_in_month).aggregate(
+        created=Count('id', filter=created_in_month),
+        completed=Count('id', filter=completed_in_month),
+    )
+    
+    incidents_created = incident_stats['created']
+    incidents_resolved = incident_stats['resolved']
+    requests_created = request_stats['created']
+    requests_completed = request_stats['completed']
+    sessions_created = session_stats['created']
+    sessions_completed = session_stats['completed']
     
     # SLA compliance
-    total_incidents_month = Incident.objects.filter(
-        created_at__gte=month_start,
-        created_at__lt=month_end
-    ).count()
-    sla_breached_month = Incident.objects.filter(
-        created_at__gte=month_start,
-        created_at__lt=month_end,
-        sla_breached=True
-    ).count()
+    total_incidents_month = incidents_created
+    sla_breached_month = incident_stats['sla_breached']
     sla_compliance = round((total_incidents_month - sla_breached_month) / total_incidents_month * 100, 1) if total_incidents_month > 0 else 100
     
     context = {
@@ -218,3 +255,96 @@ def monthly_summary(request):
     }
     
     return render(request, 'reports/monthly_summary.html', context)
+
+
+# Who queued each PDF export, so only they can poll and download it.
+# Once the key expires the file can't be downloaded any more, and
+# reports.tasks.cleanup_report_exports deletes it.
+REPORT_JOB_TIMEOUT = 24 * 60 * 60
+
+
+def _report_job_key(task_id):
+    return f'report_job:{task_id}'
+
+
+def _owns_report_job(request, task_id):
+    from django.core.cache import cache
+    return cache.get(_report_job_key(task_id)) == request.user.pk
+
+
+@require_POST
+@export_role_required
+def export_incidents_pdf(request):
+    """Queue incident report PDF generation and show its progress page."""
+    from django.core.cache import cache
+    from django.utils.dateparse import parse_date
+    from .tasks import export_incident_report_to_pdf
+    
+    start_date = parse_date(request.POST.get('start', '') or '')
+    end_date = parse_date(request.POST.get('end', '') or '')
+    
+    task = export_incident_report_to_pdf.delay(
+        start_date.isoformat() if start_date else None,
+        end_date.isoformat() if end_date else None,
+        request.user.pk,
+    )
+    cache.set(_report_job_key(task.id), request.user.pk, REPORT_JOB_TIMEOUT)
+    
+    return render(request, 'reports/pdf_status.html', {'task_id': task.id})
+
+
+@login_required
+def report_status(request, task_id):
+    """Return the state of a queued PDF export (AJAX polling)."""
+    from celery.result import AsyncResult
+    from django.http import JsonResponse
+    from django.urls import reverse
+    
+    if not _owns_report_job(request, task_id):
+        return JsonResponse({'error': 'Not found'}, status=404)
+    
+    result = AsyncResult(task_id)
+    data = {'state': result.state}
+    if result.successful() and result.result.get('path'):
+        data['download_url'] = reverse('report_download', args=[task_id])
+    return JsonResponse(data)
+
+
+@login_required
+def report_download(request, task_id):
+    """Serve a finished PDF export to the user who queued it."""
+    from celery.result import AsyncResult
+    from django.core.files.storage import default_storage
+    from django.http import FileResponse, Http404
+    
+    if not _owns_report_job(request, task_id):
+        raise Http404
+    
+    result = AsyncResult(task_id)
+    if not result.successful() or not result.result.get('path'):
+        raise Http404
+    
+    return FileResponse(
+        default_storage.open(result.result['path'], 'rb'),
+        as_attachment=True,
+        filename=f'incident_report_{timezone.now().strftime("%Y%m%d")}.pdf',
+        content_type='application/pdf',
+    )
+
+
+@export_role_required
+def export_assets_pdf(request):
+    """Asset inventory PDF, cached; answers 304 when the browser's copy is current."""
+    from .pdf_generator import generate_asset_report_response
+    return generate_asset_report_response(request)
+
+
+@export_role_required
+def export_sla_pdf(request):
+    """SLA compliance PDF for ?start=&end=, cached; answers 304 when current."""
+    from django.utils.dateparse import parse_date
+    from .pdf_generator import generate_sla_report_response
+    
+    start_date = parse_date(request.GET.get('start', '') or '')
+    end_date = parse_date(request.GET.get('end', '') or '')
+    return generate_sla_report_response(request, start_date, end_date)
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    name = 'search'
+    
+    def ready(self):
+        import search.suggestions  # noqa
+        
+        # Register the Elasticsearch documents (and their index-update
+        # signal handlers) once per process, only when search is enabled
+        from django.conf import settings
+        if getattr(settings, 'ELASTICSEARCH_ENABLED', False):
+            import search.documents  # noqa
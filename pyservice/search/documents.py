@@ -11,6 +11,7 @@ from django.conf import settings
 if getattr(settings, 'ELASTICSEARCH_ENABLED', False):
     from django_elasticsearch_dsl import Document, fields
     from django_elasticsearch_dsl.registries import registry
+    from django.db.models import Q
     from incidents.models import Incident
     from service_requests.models import ServiceRequest
     from knowledge.models import Article
@@ -60,11 +61,10 @@ if getattr(settings, 'ELASTICSEARCH_ENABLED', False):
         
         def get_instances_from_related(self, related_instance):
             if isinstance(related_instance, User):
+                # One OR'd WHERE, with the users the document embeds joined in
                 return Incident.objects.filter(
-                    caller=related_instance
-                ) | Incident.objects.filter(
-                    assigned_to=related_instance
-                )
+                    Q(caller=related_instance) | Q(assigned_to=related_instance)
+                ).select_related('caller', 'assigned_to')
     
     
     @registry.register_document
@@ -0,0 +1,89 @@
+"""
+Full-Text Matching
+PyService Mini-ITSM Platform
+
+Substring-style search served from MySQL FULLTEXT (ngram) indexes, with an
+icontains fallback on other databases.
+
+The indexes are built with innodb_ft_enable_stopword = OFF (set by the
+migrations and on the server in docker-compose.yml); with stopwords on, the
+ngram parser drops every token containing one and results diverge from
+icontains.
+"""
+
+import operator
+from functools import reduce
+
+from django.db import connections
+from django.db.models import FloatField, Func, Q, Value
+
+
+# The FULLTEXT indexes text_search relies on: index name -> (table,
+# columns). Created by RunPython migrations (incidents 0006,
+# service_requests 0005, cmdb 0008, knowledge 0002); listed here too so a
+# test database built with --nomigrations can get them from
+# create_fulltext_indexes().
+FULLTEXT_INDEXES = {
+    'inc_text_ft': ('incidents_incident', ('number', 'title', 'description')),
+    'sr_text_ft': ('service_requests_servicerequest', ('number', 'title', 'description')),
+    'asset_text_ft': ('cmdb_asset', ('name', 'serial_number', 'model_name', 'manufacturer')),
+    'article_text_ft': ('knowledge_article', ('title', 'content')),
+}
+
+
+def create_fulltext_indexes(connection):
+    """Create any missing FULLTEXT indexes on a MySQL connection."""
+    if connection.vendor != 'mysql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SET SESSION innodb_ft_enable_stopword = OFF')
+        for name, (table, columns) in FULLTEXT_INDEXES.items():
+            if name in connection.introspection.get_constraints(cursor, table):
+                continue
+            cursor.execute(
+                f"CREATE FULLTEXT INDEX {name} ON {table} ({', '.join(columns)}) WITH PARSER ngram"
+            )
+
+
+class MatchAgainst(Func):
+    """
+    MySQL MATCH (columns) AGAINST (phrase IN BOOLEAN MODE).
+    The column list must be exactly the one a FULLTEXT index was built on.
+    """
+    output_field = FloatField()
+    
+    def __init__(self, *fields, query):
+        # Quote as a phrase so operators in user input are taken literally;
+        # with the ngram parser a phrase matches like a substring
+        phrase = '"%s"' % query.replace('"', ' ')
+        super().__init__(*fields, Value(phrase))
+    
+    def as_mysql(self, compiler, connection, **extra_context):
+        *columns, phrase = self.get_source_expressions()
+        sql, params = [], []
+        for column in columns:
+            column_sql, column_params = compiler.compile(column)
+            sql.append(column_sql)
+            params.extend(column_params)
+        phrase_sql, phrase_params = compiler.compile(phrase)
+        return (
+            f"MATCH ({', '.join(sql)}) AGAINST ({phrase_sql} IN BOOLEAN MODE)",
+            (*params, *phrase_params),
+        )
+
+
+def text_search(queryset, fields, query):
+    """
+    Rows where any of fields contains query.
+    On MySQL the fields must match one FULLTEXT index; MATCH ... > 0 is
+    answered from that index instead of scanning every row with LIKE, and
+    rows come back best match first.
+    """
+    if connections[queryset.db].vendor == 'mysql':
+        return queryset.alias(
+            text_match=MatchAgainst(*fields, query=query)
+        ).filter(text_match__gt=0).order_by('-text_match')
+    
+    return queryset.filter(
+        reduce(operator.or_, (Q(**{f'{field}__icontains': query}) for field in fields))
+    )
@@ -0,0 +1,49 @@
+"""
+Deferred Search Indexing
+PyService Mini-ITSM Platform
+
+Saves on indexed models queue the object's pk in a Redis set instead of
+PUTting the document straight away; flush_search_index drains the sets
+and reindexes each batch with one bulk request.
+"""
+
+from django.core.cache import cache
+
+from core.cache import redis_client
+
+# Most ids reindexed per model per flush
+FLUSH_BATCH_SIZE = 500
+
+
+def _queue_key(model):
+    return f'search:dirty:{model._meta.label_lower}'
+
+
+def can_queue(model):
+    """Whether saves can be queued; without Redis they are indexed at once."""
+    return redis_client(cache, _queue_key(model))[0] is not None
+
+
+def queue_for_indexing(model, pk):
+    """Mark an object for the next bulk flush."""
+    client, redis_key = redis_client(cache, _queue_key(model))
+    if client is not None:
+        client.sadd(redis_key, pk)
+
+
+def pop_queued_ids(model, count=FLUSH_BATCH_SIZE):
+    """
+    Remove and return up to count queued pks for a model.
+    The caller must hand them back with requeue_ids() if reindexing fails.
+    """
+    client, redis_key = redis_client(cache, _queue_key(model))
+    if client is None:
+        return []
+    return [pk.decode() for pk in client.spop(redis_key, count) or []]
+
+
+def requeue_ids(model, ids):
+    """Put popped pks back for the next flush."""
+    client, redis_key = redis_client(cache, _queue_key(model))
+    if client is not None and ids:
+        client.sadd(redis_key, *ids)
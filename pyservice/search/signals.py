@@ -0,0 +1,32 @@
+"""
+Search Signal Processor
+PyService Mini-ITSM Platform
+
+Used as ELASTICSEARCH_DSL_SIGNAL_PROCESSOR when Elasticsearch is enabled.
+"""
+
+from django.db import transaction
+from django_elasticsearch_dsl.registries import registry
+from django_elasticsearch_dsl.signals import RealTimeSignalProcessor
+
+from .indexing import can_queue, queue_for_indexing
+
+
+class DeferredSignalProcessor(RealTimeSignalProcessor):
+    """
+    Real-time processor that batches document updates.
+    A save on an indexed model only queues its pk for flush_search_index,
+    so a burst of edits during triage becomes one bulk request instead of
+    a PUT per save. Deletes and related-model updates stay immediate.
+    """
+    
+    def handle_save(self, sender, instance, **kwargs):
+        model = instance.__class__
+        if model in registry.get_models() and can_queue(model):
+            # Queue once the save is committed: a flush running before then
+            # would index the old row, and a rolled-back save needs no reindex
+            pk = instance.pk
+            transaction.on_commit(lambda: queue_for_indexing(model, pk))
+            registry.update_related(instance)
+            return
+        super().handle_save(sender, instance, **kwargs)
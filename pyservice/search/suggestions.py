@@ -0,0 +1,243 @@
+"""
+Search Suggestions Index
+PyService Mini-ITSM Platform
+
+In-process index behind SearchSuggestionsView. Each worker keeps a sorted
+key list per model and answers a keystroke with a binary search instead of
+two LIKE queries. Every suffix of every title/name word is a key, so a
+prefix search finds the same substring matches as title__icontains /
+name__icontains did ("rinter" still suggests "Printer"); incident numbers
+and serials are matched from the start, like istartswith.
+
+Saves and deletes are appended to a short change log in the cache under
+an increasing sequence number. A worker that sees a newer sequence
+re-reads only the changed rows (one query per model) and patches them
+into a copy of its indexes; the full tables are only scanned when a
+process starts or falls too far behind the log.
+
+Published indexes are never modified: catching up builds new ones and
+swaps them in with a single assignment, so request threads sharing a
+worker can search while another thread applies changes.
+"""
+
+import logging
+from bisect import bisect_left, insort
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from cmdb.models import Asset
+from incidents.models import Incident
+
+logger = logging.getLogger(__name__)
+
+SUGGESTIONS_VERSION_KEY = 'search:suggestions:version'
+
+# Changes kept for workers to catch up from; a worker further behind than
+# either limit rebuilds from scratch instead
+SUGGESTIONS_CHANGE_TIMEOUT = 60 * 60 * 24
+SUGGESTIONS_MAX_CHANGES = 500
+
+# Fields whose change alters the index; saves touching only other
+# fields (e.g. the SLA checker's update_fields=['sla_breached']) skip it
+_INDEXED_FIELDS = {
+    Incident: {'number', 'title'},
+    Asset: {'name', 'serial_number'},
+}
+
+_state = {}
+
+
+def _substring_keys(text):
+    """Every suffix of every word, so a key prefix is any in-word substring."""
+    return {word[i:] for word in text.lower().split() for i in range(len(word))}
+
+
+def _incident_entry(number, title):
+    """Display value and search keys for an incident."""
+    return (number, title), {number.lower(), *_substring_keys(title)}
+
+
+def _asset_entry(name, serial):
+    """Display value and search keys for an asset."""
+    keys = _substring_keys(name)
+    if serial:
+        keys.add(serial.lower())
+    return (name, serial), keys
+
+
+# index name -> (model, columns read, entry builder)
+_SOURCES = {
+    'incidents': (Incident, ('number', 'title'), _incident_entry),
+    'assets': (Asset, ('name', 'serial_number'), _asset_entry),
+}
+_INDEX_NAMES = {model: name for name, (model, _, _) in _SOURCES.items()}
+
+
+class PrefixIndex:
+    """
+    Sorted (key, pk) pairs searchable by key prefix.
+    Rows can be added, replaced and removed in place, so a change to one
+    row costs a few list inserts rather than a rebuild. add() and remove()
+    are not thread-safe: only call them on a copy() no other thread sees.
+    """
+
+    def __init__(self, rows=()):
+        self._entries = []
+        self._rows = {}
+        for pk, value, keys in rows:
+            self._rows[pk] = (value, keys)
+            self._entries.extend((key, pk) for key in keys)
+        self._entries.sort()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def copy(self):
+        """An independent index with the same rows, for patching."""
+        index = PrefixIndex()
+        index._entries = list(self._entries)
+        index._rows = dict(self._rows)
+        return index
+
+    def search(self, prefix, limit):
+        """Up to limit distinct values with a key starting with prefix."""
+        results = []
+        seen = set()
+        for i in range(bisect_left(self._entries, (prefix,)), len(self._entries)):
+            key, pk = self._entries[i]
+            if not key.startswith(prefix):
+                break
+            if pk not in seen:
+                seen.add(pk)
+                results.append(self._rows[pk][0])
+                if len(results) == limit:
+                    break
+        return results
+
+    def add(self, pk, value, keys):
+        """Index a row, replacing whatever was indexed for pk before."""
+        self.remove(pk)
+        self._rows[pk] = (value, keys)
+        for key in keys:
+            insort(self._entries, (key, pk))
+
+    def remove(self, pk):
+        """Drop a row from the index; unknown pks are ignored."""
+        _, keys = self._rows.pop(pk, (None, ()))
+        for key in keys:
+            i = bisect_left(self._entries, (key, pk))
+            if i < len(self._entries) and self._entries[i] == (key, pk):
+                del self._entries[i]
+
+
+def _rows(name, pks=None):
+    """(pk, value, keys) for every row of an index, or only for pks."""
+    model, columns, build = _SOURCES[name]
+    queryset = model.objects.order_by()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    for pk, *values in queryset.values_list('pk', *columns).iterator():
+        yield (pk, *build(*values))
+
+
+def _build_indexes():
+    return {name: PrefixIndex(_rows(name)) for name in _SOURCES}
+
+
+def _change_key(seq):
+    return f'{SUGGESTIONS_VERSION_KEY}:{seq}'
+
+
+def _apply_changes(indexes, changes):
+    """
+    Indexes with the changed rows re-read and patched in.
+    Touched indexes are patched on a copy; the ones passed in are left as
+    they were, since other threads may be searching them.
+    """
+    changed = {}
+    for name, pk in changes:
+        changed.setdefault(name, set()).add(pk)
+
+    patched = dict(indexes)
+    for name, pks in changed.items():
+        index = patched[name] = indexes[name].copy()
+        found = set()
+        for pk, value, keys in _rows(name, pks):
+            index.add(pk, value, keys)
+            found.add(pk)
+        # Rows that no longer exist were deleted
+        for pk in pks - found:
+            index.remove(pk)
+    return patched
+
+
+def get_indexes():
+    """This process's indexes, caught up with changes made by any process."""
+    cache.add(SUGGESTIONS_VERSION_KEY, 0, None)
+    version = cache.get(SUGGESTIONS_VERSION_KEY)
+
+    # (version, indexes) are read and replaced as one value, so a thread
+    # never pairs one version with another's indexes
+    published = _state.get('published')
+    if published is None:
+        indexes = _build_indexes()
+        _state['published'] = (version, indexes)
+        return indexes
+
+    current, indexes = published
+    if version == current:
+        return indexes
+
+    if current is None or version is None or not 0 < version - current <= SUGGESTIONS_MAX_CHANGES:
+        changes = None
+    else:
+        keys = [_change_key(seq) for seq in range(current + 1, version + 1)]
+        logged = cache.get_many(keys)
+        changes = [logged[key] for key in keys if key in logged]
+        if len(changes) != len(keys):
+            # Log expired (or a writer is between bumping the version and
+            # recording its change); only a full pass is certain to be right
+            changes = None
+
+    if changes is None:
+        logger.info("Rebuilding search suggestion indexes (at %s, log at %s)", current, version)
+        indexes = _build_indexes()
+    else:
+        indexes = _apply_changes(indexes, changes)
+    # Two threads catching up at once each publish complete indexes; if
+    # the older one lands last, the next call just replays from there
+    _state['published'] = (version, indexes)
+    return indexes
+
+
+def record_change(name, pk):
+    """Log a changed row so every process patches it into its index."""
+    try:
+        seq = cache.incr(SUGGESTIONS_VERSION_KEY)
+    except ValueError:
+        # Version key lost (cache flushed): restart the log; processes
+        # holding an older version rebuild once
+        cache.set(SUGGESTIONS_VERSION_KEY, 0, None)
+        seq = cache.incr(SUGGESTIONS_VERSION_KEY)
+    cache.set(_change_key(seq), (name, pk), SUGGESTIONS_CHANGE_TIMEOUT)
+
+
+def _record_change_on_commit(sender, pk):
+    name = _INDEX_NAMES[sender]
+    transaction.on_commit(lambda: record_change(name, pk))
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_save, sender=Asset)
+def suggestions_changed_on_save(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or _INDEXED_FIELDS[sender] & set(update_fields):
+        _record_change_on_commit(sender, instance.pk)
+
+
+@receiver(post_delete, sender=Incident)
+@receiver(post_delete, sender=Asset)
+def suggestions_changed_on_delete(sender, instance, **kwargs):
+    _record_change_on_commit(sender, instance.pk)
@@ -0,0 +1,49 @@
+"""
+Search Tasks
+PyService Mini-ITSM Platform
+
+Celery tasks for keeping the Elasticsearch indexes up to date.
+"""
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(ignore_result=True)
+def flush_search_index():
+    """
+    Bulk-reindex objects queued by DeferredSignalProcessor.
+    A batch that fails to index is requeued for the next run.
+    Runs every 5 seconds via Celery Beat when Elasticsearch is enabled.
+    """
+    if not getattr(settings, 'ELASTICSEARCH_ENABLED', False):
+        return 0
+    
+    from django_elasticsearch_dsl.registries import registry
+    from .indexing import pop_queued_ids, requeue_ids
+    
+    indexed = 0
+    for model in registry.get_models():
+        ids = pop_queued_ids(model)
+        if not ids:
+            continue
+        
+        try:
+            for document_class in registry.get_documents([model]):
+                document = document_class()
+                # Document.update() sends an iterable as a single _bulk request
+                document.update(document.get_queryset().filter(pk__in=ids))
+        except Exception as exc:
+            # Hand the batch back so the next flush retries it, and carry on
+            # with the other models
+            requeue_ids(model, ids)
+            logger.error(f"Failed to reindex {len(ids)} {model._meta.label} documents: {exc}")
+            continue
+        indexed += len(ids)
+    
+    if indexed:
+        logger.info(f"Bulk reindexed {indexed} search documents")
+    return indexed
@@ -0,0 +1,202 @@
+"""
+Search Tests
+PyService Mini-ITSM Platform
+
+Tests for the suggestion prefix index and its cross-process updates, and
+for full-text matching.
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from incidents.models import Incident
+from search import suggestions
+from search.fulltext import text_search
+from search.suggestions import PrefixIndex
+
+User = get_user_model()
+
+
+@pytest.fixture
+def fresh_indexes():
+    """Start from an empty cache and no in-process indexes."""
+    cache.clear()
+    suggestions._state.clear()
+    yield
+    suggestions._state.clear()
+
+
+class TestPrefixIndex:
+    """Test PrefixIndex lookups and in-place updates"""
+
+    def test_search_by_prefix(self):
+        """Test values are found by any key prefix, each value once"""
+        index = PrefixIndex([
+            (1, 'Printer down', {'printer', 'down'}),
+            (2, 'Print queue', {'print', 'queue'}),
+            (3, 'Laptop', {'laptop'}),
+        ])
+        assert index.search('print', 5) == ['Print queue', 'Printer down']
+        assert index.search('printe', 5) == ['Printer down']
+        assert index.search('d', 5) == ['Printer down']
+        assert index.search('zz', 5) == []
+        assert len(index.search('', 2)) == 2
+
+    def test_add_replaces_and_remove_drops(self):
+        """Test a row can be re-indexed and removed without a rebuild"""
+        index = PrefixIndex([(1, 'Printer down', {'printer', 'down'})])
+        index.add(1, 'Scanner down', {'scanner', 'down'})
+        assert index.search('printer', 5) == []
+        assert index.search('scan', 5) == ['Scanner down']
+        index.add(2, 'Down again', {'down', 'again'})
+        assert index.search('down', 5) == ['Scanner down', 'Down again']
+        index.remove(1)
+        index.remove(99)
+        assert index.search('down', 5) == ['Down again']
+        assert len(index) == 1
+
+
+@pytest.mark.django_db
+class TestSuggestionIndexes:
+    """Test indexes follow saves and deletes without full rebuilds"""
+
+    def test_changes_are_patched_in(self, fresh_indexes, django_capture_on_commit_callbacks, monkeypatch):
+        """Test a save or delete is applied to an existing index in place"""
+        caller = User.objects.create_user(username="caller", password="test")
+        with django_capture_on_commit_callbacks(execute=True):
+            printer = Incident.objects.create(title="Printer down", description="d", caller=caller)
+        assert suggestions.get_indexes()['incidents'].search('printer', 5) == [
+            (printer.number, 'Printer down')
+        ]
+
+        def no_rebuild():
+            raise AssertionError("indexes were rebuilt")
+        monkeypatch.setattr(suggestions, '_build_indexes', no_rebuild)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            printer.title = "Scanner jammed"
+            printer.save()
+            Incident.objects.create(title="Printer toner", description="d", caller=caller)
+        incidents = suggestions.get_indexes()['incidents']
+        assert incidents.search('scan', 5) == [(printer.number, 'Scanner jammed')]
+        assert [title for _, title in incidents.search('printer', 5)] == ['Printer toner']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            printer.delete()
+        assert suggestions.get_indexes()['incidents'].search('scan', 5) == []
+
+    def test_untracked_field_save_is_not_logged(self, fresh_indexes, django_capture_on_commit_callbacks):
+        """Test saves that only touch unindexed fields leave the log alone"""
+        caller = User.objects.create_user(username="caller", password="test")
+        incident = Incident.objects.create(title="Printer down", description="d", caller=caller)
+        suggestions.get_indexes()
+        with django_capture_on_commit_callbacks(execute=True):
+            incident.sla_breached = True
+            incident.save(update_fields=['sla_breached'])
+        assert cache.get(suggestions.SUGGESTIONS_VERSION_KEY) == 0
+
+    def test_expired_log_rebuilds(self, fresh_indexes, django_capture_on_commit_callbacks):
+        """Test a process that missed changes falls back to a full rebuild"""
+        caller = User.objects.create_user(username="caller", password="test")
+        suggestions.get_indexes()
+        with django_capture_on_commit_callbacks(execute=True):
+            incident = Incident.objects.create(title="Printer down", description="d", caller=caller)
+        cache.delete(suggestions._change_key(1))
+        assert suggestions.get_indexes()['incidents'].search('printer', 5) == [
+            (incident.number, 'Printer down')
+        ]
+
+    def test_single_word_matches_inside_words(self, fresh_indexes):
+        """Test a query matches anywhere in a title word, like icontains"""
+        caller = User.objects.create_user(username="caller", password="test")
+        incident = Incident.objects.create(title="Printer down", description="d", caller=caller)
+        incidents = suggestions.get_indexes()['incidents']
+        assert incidents.search('rinter', 5) == [(incident.number, 'Printer down')]
+        assert incidents.search('own', 5) == [(incident.number, 'Printer down')]
+        # Numbers still only match from the start, like istartswith
+        assert incidents.search(incident.number[1:].lower(), 5) == []
+
+
+class TestSuggestionIndexThreads:
+    """Test catch-up is safe with searches running in other threads"""
+
+    def test_concurrent_catch_up_and_search(self, fresh_indexes, monkeypatch):
+        """Test readers never fail and the final index matches a rebuild"""
+        titles = {pk: f'Printer {pk}' for pk in range(1, 51)}
+        titles_lock = threading.Lock()
+
+        def fake_rows(name, pks=None):
+            # Stands in for the database read of the changed rows
+            with titles_lock:
+                rows = dict(titles)
+            for pk in sorted(rows if pks is None else set(pks) & set(rows)):
+                yield (pk, *suggestions._incident_entry(f'INC{pk:07d}', rows[pk]))
+                # Let other threads run mid-patch
+                time.sleep(0)
+
+        monkeypatch.setattr(suggestions, '_rows', fake_rows)
+        suggestions.get_indexes()
+
+        errors = []
+        done = threading.Event()
+
+        def read():
+            try:
+                while not done.is_set():
+                    for value in suggestions.get_indexes()['incidents'].search('r', 100):
+                        assert value[1].startswith('Printer')
+            except Exception as exc:
+                errors.append(exc)
+
+        # Switch threads as often as possible to interleave them
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        try:
+            for i in range(1000):
+                pk = i % 60 + 1
+                with titles_lock:
+                    if pk in titles and i % 3 == 0:
+                        del titles[pk]
+                    else:
+                        titles[pk] = f'Printer {pk} rev {i}'
+                suggestions.record_change('incidents', pk)
+                time.sleep(0)
+        finally:
+            done.set()
+            for thread in readers:
+                thread.join()
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        final = suggestions.get_indexes()['incidents']
+        expected = PrefixIndex(fake_rows('incidents'))
+        assert final._entries == expected._entries
+        assert final._rows == expected._rows
+
+
+# FULLTEXT indexes only see committed rows, so these tests commit for real
+@pytest.mark.django_db(transaction=True)
+class TestTextSearch:
+    """Test text_search finds what icontains finds (FULLTEXT on MySQL)"""
+
+    def test_matches_icontains(self):
+        """Test in-word substrings match, including stopword letters"""
+        caller = User.objects.create_user(username="caller", password="test")
+        for title in ("Printer is down", "Print queue stuck", "Laptop cable", "VPN"):
+            Incident.objects.create(title=title, description="Reported by phone", caller=caller)
+
+        fields = ['number', 'title', 'description']
+        for query in ('rint', 'is', 'ap', 'able', 'phone', 'zzz'):
+            found = text_search(Incident.objects.all(), fields, query)
+            expected = Incident.objects.filter(title__icontains=query) | Incident.objects.filter(
+                description__icontains=query
+            )
+            assert set(found) == set(expected), query
@@ -10,11 +10,103 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
+from django.db.models.functions import Substr
+import hashlib
 import logging
+import time
+
+from cmdb.models import Asset
+from incidents.models import Incident
+from knowledge.models import Article
+from service_requests.models import ServiceRequest
+
+from .fulltext import text_search
+from .suggestions import get_indexes
 
 logger = logging.getLogger(__name__)
 
+# Repeat searches within this window share one backend call; results may
+# lag a save by up to this long
+SEARCH_CACHE_TIMEOUT = 30
+
+# A query already running in another worker is waited on for at most this
+# long before running it again here
+SEARCH_WAIT_SECONDS = 0.5
+SEARCH_LOCK_TIMEOUT = 5
+
+# Incident titles are cut to this many characters in suggestion labels
+SUGGESTION_TITLE_LENGTH = 40
+
+
+def search_cache_key(prefix, query, *parts):
+    """Cache key for a normalised query (both engines match case-insensitively)."""
+    digest = hashlib.blake2b(query.lower().encode(), digest_size=8).hexdigest()
+    return ':'.join(['search', prefix, *map(str, parts), digest])
+
+
+def cached_search(cache_key, compute):
+    """
+    Cached result of compute(), with concurrent misses coalesced.
+    The first worker to miss takes a short cache lock (SETNX on Redis) and
+    runs the query; workers missing meanwhile poll for its result instead
+    of sending the same query to the backend.
+    """
+    found = cache.get(cache_key)
+    if found is not None:
+        return found
+    
+    lock_key = f'{cache_key}:lock'
+    if not cache.add(lock_key, 1, SEARCH_LOCK_TIMEOUT):
+        deadline = time.monotonic() + SEARCH_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            found = cache.get(cache_key)
+            if found is not None:
+                return found
+        # Leader is slow or failed; answer this request directly
+        return compute()
+    
+    try:
+        found = compute()
+        cache.set(cache_key, found, SEARCH_CACHE_TIMEOUT)
+    finally:
+        cache.delete(lock_key)
+    return found
+
+
+# type -> (queryset, fields searched, fields returned) for the ORM engine
+_ORM_SEARCHES = {
+    'incidents': (
+        lambda: Incident.objects.all(),
+        ['number', 'title', 'description'],
+        ['id', 'number', 'title', 'state', 'priority'],
+    ),
+    'requests': (
+        lambda: ServiceRequest.objects.all(),
+        ['number', 'title', 'description'],
+        ['id', 'number', 'title', 'state'],
+    ),
+    'assets': (
+        lambda: Asset.objects.all(),
+        ['name', 'serial_number', 'model_name', 'manufacturer'],
+        ['id', 'name', 'serial_number', 'status'],
+    ),
+    'articles': (
+        lambda: Article.objects.filter(is_published=True),
+        ['title', 'content'],
+        ['id', 'title'],
+    ),
+}
+
+
+def _search_types(handlers, search_type):
+    """Handler keys to run for a requested type ('all' runs every one)."""
+    if search_type == 'all':
+        return list(handlers)
+    return [search_type] if search_type in handlers else []
+
 
 class GlobalSearchView(APIView):
     """
@@ -45,152 +137,81 @@ class GlobalSearchView(APIView):
         
         if getattr(settings, 'ELASTICSEARCH_ENABLED', False):
             # Use Elasticsearch
-            results['results'] = self._elasticsearch_search(query, search_type, limit)
-            results['engine'] = 'elasticsearch'
+            engine, search = 'elasticsearch', self._elasticsearch_search
         else:
             # Fall back to Django ORM
-            results['results'] = self._orm_search(query, search_type, limit)
-            results['engine'] = 'django_orm'
+            engine, search = 'django_orm', self._orm_search
+        
+        results['results'] = cached_search(
+            search_cache_key(engine, query, search_type, limit),
+            lambda: search(query, search_type, limit)
+        )
+        results['engine'] = engine
         
         return Response(results)
     
     def _elasticsearch_search(self, query, search_type, limit):
-        """Search using Elasticsearch."""
+        """Search using Elasticsearch, all indexes in one _msearch request."""
+        from elasticsearch_dsl import MultiSearch
         from .documents import IncidentDocument, AssetDocument, ArticleDocument
         
-        results = {}
-        
-        if search_type in ['all', 'incidents']:
-            incidents = IncidentDocument.search().query(
+        # type -> (search, hit serializer)
+        handlers = {
+            'incidents': lambda: (IncidentDocument.search().query(
                 'multi_match',
                 query=query,
                 fields=['number', 'title', 'description', 'resolution_notes']
-            )[:limit]
-            
-            results['incidents'] = [
-                {
-                    'id': hit.id,
-                    'number': hit.number,
-                    'title': hit.title,
-                    'state': hit.state,
-                    'priority': hit.priority,
-                    'score': hit.meta.score,
-                }
-                for hit in incidents
-            ]
-        
-        if search_type in ['all', 'assets']:
-            assets = AssetDocument.search().query(
+            )[:limit], lambda hit: {
+                'id': hit.id,
+                'number': hit.number,
+                'title': hit.title,
+                'state': hit.state,
+                'priority': hit.priority,
+                'score': hit.meta.score,
+            }),
+            'assets': lambda: (AssetDocument.search().query(
                 'multi_match',
                 query=query,
                 fields=['name', 'serial_number', 'model_name', 'manufacturer']
-            )[:limit]
-            
-            results['assets'] = [
-                {
-                    'id': hit.id,
-                    'name': hit.name,
-                    'serial_number': hit.serial_number,
-                    'status': hit.status,
-                    'score': hit.meta.score,
-                }
-                for hit in assets
-            ]
-        
-        if search_type in ['all', 'articles']:
-            articles = ArticleDocument.search().query(
+            )[:limit], lambda hit: {
+                'id': hit.id,
+                'name': hit.name,
+                'serial_number': hit.serial_number,
+                'status': hit.status,
+                'score': hit.meta.score,
+            }),
+            'articles': lambda: (ArticleDocument.search().query(
                 'multi_match',
                 query=query,
                 fields=['title', 'content']
-            ).filter('term', is_published=True)[:limit]
-            
-            results['articles'] = [
-                {
-                    'id': hit.id,
-                    'title': hit.title,
-                    'score': hit.meta.score,
-                }
-                for hit in articles
-            ]
+            ).filter('term', is_published=True)[:limit], lambda hit: {
+                'id': hit.id,
+                'title': hit.title,
+                'score': hit.meta.score,
+            }),
+        }
         
-        return results
+        searches = [(key, *handlers[key]()) for key in _search_types(handlers, search_type)]
+        if not searches:
+            return {}
+        
+        multi_search = MultiSearch()
+        for _, search, _ in searches:
+            multi_search = multi_search.add(search)
+        
+        return {
+            key: [serialize(hit) for hit in response]
+            for (key, _, serialize), response in zip(searches, multi_search.execute())
+        }
     
     def _orm_search(self, query, search_type, limit):
         """Search using Django ORM (fallback)."""
-        from incidents.models import Incident
-        from service_requests.models import ServiceRequest
-        from cmdb.models import Asset
-        from knowledge.models import Article
-        
         results = {}
         
-        if search_type in ['all', 'incidents']:
-            incidents = Incident.objects.filter(
-                Q(number__icontains=query) |
-                Q(title__icontains=query) |
-                Q(description__icontains=query)
-            )[:limit]
-            
-            results['incidents'] = [
-                {
-                    'id': inc.pk,
-                    'number': inc.number,
-                    'title': inc.title,
-                    'state': inc.state,
-                    'priority': inc.priority,
-                }
-                for inc in incidents
-            ]
-        
-        if search_type in ['all', 'requests']:
-            requests = ServiceRequest.objects.filter(
-                Q(number__icontains=query) |
-                Q(title__icontains=query) |
-                Q(description__icontains=query)
-            )[:limit]
-            
-            results['requests'] = [
-                {
-                    'id': req.pk,
-                    'number': req.number,
-                    'title': req.title,
-                    'state': req.state,
-                }
-                for req in requests
-            ]
-        
-        if search_type in ['all', 'assets']:
-            assets = Asset.objects.filter(
-                Q(name__icontains=query) |
-                Q(serial_number__icontains=query) |
-                Q(model_name__icontains=query) |
-                Q(manufacturer__icontains=query)
-            )[:limit]
-            
-            results['assets'] = [
-                {
-                    'id': asset.pk,
-                    'name': asset.name,
-                    'serial_number': asset.serial_number,
-                    'status': asset.status,
-                }
-                for asset in assets
-            ]
-        
-        if search_type in ['all', 'articles']:
-            articles = Article.objects.filter(
-                Q(title__icontains=query) |
-                Q(content__icontains=query),
-                is_published=True
-            )[:limit]
-            
-            results['articles'] = [
-                {
-                    'id': article.pk,
-                    'title': article.title,
-                }
-                for article in articles
-            ]
+        for key in _search_types(_ORM_SEARCHES, search_type):
+            get_queryset, search_fields, value_fields = _ORM_SEARCHES[key]
+            found = text_search(get_queryset(), search_fields, query).values(*value_fields)[:limit]
+            results[key] = list(found)
         
         return results
 
@@ -209,27 +230,28 @@ class SearchSuggestionsView(APIView):
         
         suggestions = []
         
-        # Get incident number suggestions
-        from incidents.models import Incident
-        incidents = Incident.objects.filter(
-            Q(number__istartswith=query) |
-            Q(title__icontains=query)
-        ).values_list('number', 'title')[:5]
+        if ' ' in query:
+            # Whole-phrase matches need the database; cached briefly since
+            # the same phrase is typed out by many users
+            incidents, assets = cached_search(
+                search_cache_key('suggest', query),
+                lambda: self._orm_suggestions(query)
+            )
+        else:
+            indexes = get_indexes()
+            incidents = indexes['incidents'].search(query.lower(), 5)
+            assets = indexes['assets'].search(query.lower(), 5)
         
         for number, title in incidents:
             suggestions.append({
                 'type': 'incident',
                 'value': number,
-                'label': f'{number}: {title[:40]}...' if len(title) > 40 else f'{number}: {title}'
+                'label': (
+                    f'{number}: {title[:SUGGESTION_TITLE_LENGTH]}...'
+                    if len(title) > SUGGESTION_TITLE_LENGTH else f'{number}: {title}'
+                )
             })
         
-        # Get asset suggestions
-        from cmdb.models import Asset
-        assets = Asset.objects.filter(
-            Q(name__icontains=query) |
-            Q(serial_number__istartswith=query)
-        ).values_list('name', 'serial_number')[:5]
-        
         for name, serial in assets:
             suggestions.append({
                 'type': 'asset',
@@ -238,3 +260,19 @@ class SearchSuggestionsView(APIView):
             })
         
         return Response({'suggestions': suggestions[:10]})
+    
+    def _orm_suggestions(self, query):
+        """Suggestions straight from the database."""
+        # Only fetch the part of the title the label shows, plus one
+        # character so the label still knows whether it was cut
+        incidents = Incident.objects.filter(
+            Q(number__istartswith=query) |
+            Q(title__icontains=query)
+        ).values_list('number', Substr('title', 1, SUGGESTION_TITLE_LENGTH + 1))[:5]
+        
+        assets = Asset.objects.filter(
+            Q(name__icontains=query) |
+            Q(serial_number__istartswith=query)
+        ).values_list('name', 'serial_number')[:5]
+        
+        return list(incidents), list(assets)
@@ -10,6 +10,7 @@ from .models import ServiceRequest
 @admin.register(ServiceRequest)
 class ServiceRequestAdmin(admin.ModelAdmin):
     list_display = ['number', 'title', 'request_type', 'state', 'requester', 'assigned_to', 'created_at']
+    list_select_related = ['requester', 'assigned_to']
     list_filter = ['state', 'request_type']
     search_fields = ['number', 'title', 'description']
     ordering = ['-created_at']
@@ -43,19 +44,9 @@ class ServiceRequestAdmin(admin.ModelAdmin):
     actions = ['approve_requests', 'reject_requests']
     
     def approve_requests(self, request, queryset):
-        from django.utils import timezone
-        queryset.filter(state='awaiting_approval').update(
-            state='approved',
-            approver=request.user,
-            approved_at=timezone.now()
-        )
+        ServiceRequest.bulk_approve(queryset, request.user)
     approve_requests.short_description = "Approve selected requests"
     
     def reject_requests(self, request, queryset):
-        from django.utils import timezone
-        queryset.filter(state='awaiting_approval').update(
-            state='rejected',
-            approver=request.user,
-            rejected_at=timezone.now()
-        )
+        ServiceRequest.bulk_reject(queryset, request.user)
     reject_requests.short_description = "Reject selected requests"
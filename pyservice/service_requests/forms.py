@@ -4,17 +4,24 @@ PyService Mini-ITSM Platform
 """
 
 from django import forms
+from cmdb.models import Asset, User
 from .models import ServiceRequest
 
+# Asset type choices are fixed, so the select's options are built once
+ASSET_TYPE_CHOICES = [('', '--- Select Asset Type ---')] + list(Asset.ASSET_TYPE_CHOICES)
+
 
 class ServiceRequestForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        # Dynamically populate asset type choices from Asset model
-        from cmdb.models import Asset
-        self.fields['requested_asset_type'].choices = [('', '--- Select Asset Type ---')] + list(Asset.ASSET_TYPE_CHOICES)
+        # Asset type choices come from the Asset model
+        self.fields['requested_asset_type'].choices = ASSET_TYPE_CHOICES
         self.fields['requested_asset_type'].required = False
+        # The requester select only needs what User.__str__ shows
+        self.fields['requester'].queryset = User.objects.only(
+            'username', 'first_name', 'last_name', 'role'
+        )
         
     class Meta:
         model = ServiceRequest
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('service_requests', '0003_servicerequest_allocated_asset_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['created_at'], name='sr_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['completed_at'], name='sr_completed_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('service_requests', '0005_servicerequest_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='servicerequest',
+            options={'ordering': ['-created_at'], 'verbose_name': 'Service Request', 'verbose_name_plural': 'Service Requests'},
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['state', '-created_at'], name='svc_req_state_created'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-16 15:50
+
+import core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("service_requests", "0006_servicerequest_state_created_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="servicerequest",
+            name="state",
+            field=core.fields.EnumCharField(
+                choices=[
+                    ("draft", "Draft"),
+                    ("awaiting_approval", "Awaiting Approval"),
+                    ("approved", "Approved"),
+                    ("assigned", "Assigned"),
+                    ("in_progress", "In Progress"),
+                    ("needs_help", "Needs Advanced Help"),
+                    ("completed", "Completed"),
+                    ("rejected", "Rejected"),
+                    ("cancelled", "Cancelled"),
+                ],
+                default="draft",
+                max_length=20,
+            ),
+        ),
+    ]
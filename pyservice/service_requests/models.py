@@ -7,9 +7,20 @@ This module implements service request workflow:
 - Manager approval workflow
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
+from cmdb.models import Asset
+from core.fields import EnumCharField
+from core.models import NumberSequence
+
+
+# States each workflow action may start from
+_ASSIGNABLE = frozenset({'approved', 'assigned'})
+_CLAIMABLE = frozenset({'draft', 'approved', 'needs_help'})
+_COMPLETABLE = frozenset({'assigned', 'in_progress', 'needs_help'})
+_CANCELLABLE = frozenset({'draft', 'awaiting_approval'})
+
 
 class ServiceRequest(models.Model):
     """
@@ -98,7 +109,7 @@ class ServiceRequest(models.Model):
     )
     
     # State and workflow
-    state = models.CharField(max_length=20, choices=STATE_CHOICES, default='draft')
+    state = EnumCharField(max_length=20, choices=STATE_CHOICES, default='draft')
     
     # Approval tracking
     approval_notes = models.TextField(blank=True)
@@ -114,13 +125,14 @@ class ServiceRequest(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = [
-            models.Case(
-                models.When(state='completed', then=1),
-                default=0,
-                output_field=models.IntegerField()
-            ),
-            '-created_at'
+        # Plain column ordering so listings can walk an index; views that
+        # want completed requests last ask for it explicitly
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['state', '-created_at'], name='svc_req_state_created'),
+            # Reports: created / completed date ranges
+            models.Index(fields=['created_at'], name='sr_created_idx'),
+            models.Index(fields=['completed_at'], name='sr_completed_idx'),
         ]
         verbose_name = 'Service Request'
         verbose_name_plural = 'Service Requests'
@@ -135,14 +147,19 @@ class ServiceRequest(models.Model):
 
     def _generate_request_number(self):
         """Generate unique request number like REQ0001234"""
-        last_request = ServiceRequest.objects.order_by('-id').first()
-        if last_request and last_request.number:
-            try:
-                last_num = int(last_request.number.replace('REQ', ''))
-                return f"REQ{str(last_num + 1).zfill(7)}"
-            except ValueError:
-                pass
-        return "REQ0000001"
+        number = NumberSequence.next_value('service_request', start=self._last_request_number)
+        return f"REQ{str(number).zfill(7)}"
+
+    @staticmethod
+    def _last_request_number():
+        """Highest REQ number already issued; seeds the sequence on first use."""
+        last = ServiceRequest.objects.filter(number__startswith='REQ').aggregate(
+            last=models.Max('number')
+        )['last']
+        try:
+            return int(last.replace('REQ', '')) if last else 0
+        except ValueError:
+            return 0
 
     # Workflow actions
     def auto_assign_asset_if_available(self):
@@ -156,31 +173,31 @@ class ServiceRequest(models.Model):
         """
         if not self.requested_asset_type:
             return False
-        
-        # Import here to avoid circular imports
-        from cmdb.models import Asset
-        
-        # Find first available asset of requested type
-        available_asset = Asset.objects.filter(
-            asset_type=self.requested_asset_type,
-            status='in_stock',
-            assigned_to__isnull=True
-        ).first()
-        
-        if available_asset:
-            # Asset available - auto-assign it
-            available_asset.assign_to_user(self.requester)
-            self.allocated_asset = available_asset
-            self.state = 'approved'  # Auto-approve since asset is available
-            self.approved_at = timezone.now()
-            self.approval_notes = 'Auto-approved: Asset available in stock'
-            self.save()
-            return True
-        else:
-            # No asset available - needs admin approval
-            self.state = 'awaiting_approval'
-            self.save()
-            return False
+
+        with transaction.atomic():
+            # Lock the first available asset of requested type; rows another
+            # request is already taking are skipped rather than waited on,
+            # so two requests can never be given the same asset
+            available_asset = Asset.objects.select_for_update(skip_locked=True).filter(
+                asset_type=self.requested_asset_type,
+                status='in_stock',
+                assigned_to__isnull=True
+            ).order_by('pk').first()
+
+            if available_asset:
+                # Asset available - auto-assign it
+                available_asset.assign_to_user(self.requester)
+                self.allocated_asset = available_asset
+                self.state = 'approved'  # Auto-approve since asset is available
+                self.approved_at = timezone.now()
+                self.approval_notes = 'Auto-approved: Asset available in stock'
+                self.save(update_fields=['allocated_asset', 'state', 'approved_at', 'approval_notes', 'updated_at'])
+                return True
+
+        # No asset available - needs admin approval
+        self.state = 'awaiting_approval'
+        self.save(update_fields=['state', 'updated_at'])
+        return False
     
     def submit(self):
         """
@@ -195,7 +212,7 @@ class ServiceRequest(models.Model):
             else:
                 # Normal request - needs approval
                 self.state = 'awaiting_approval'
-                self.save()
+                self.save(update_fields=['state', 'updated_at'])
             return True
         return False
 
@@ -206,7 +223,7 @@ class ServiceRequest(models.Model):
             self.approver = approver
             self.approval_notes = notes
             self.approved_at = timezone.now()
-            self.save()
+            self.save(update_fields=['state', 'approver', 'approval_notes', 'approved_at', 'updated_at'])
             return True
         return False
 
@@ -217,31 +234,31 @@ class ServiceRequest(models.Model):
             self.approver = approver
             self.approval_notes = notes
             self.rejected_at = timezone.now()
-            self.save()
+            self.save(update_fields=['state', 'approver', 'approval_notes', 'rejected_at', 'updated_at'])
             return True
         return False
 
     def assign(self, assignee):
         """Assign to IT staff for fulfillment."""
-        if self.state in ['approved', 'assigned']:
+        if self.state in _ASSIGNABLE:
             self.state = 'assigned'
             self.assigned_to = assignee
-            self.save()
+            self.save(update_fields=['state', 'assigned_to', 'updated_at'])
             return True
         return False
 
     def claim(self, support_user):
         """Support staff claims this request - I'll handle it."""
-        if self.state in ['draft', 'approved', 'needs_help'] and not self.assigned_to:
+        if self.state in _CLAIMABLE and not self.assigned_to:
             self.state = 'in_progress'
             self.assigned_to = support_user
-            self.save()
+            self.save(update_fields=['state', 'assigned_to', 'updated_at'])
             return True
         elif self.state == 'needs_help':
             # Another support can take over
             self.state = 'in_progress'
             self.assigned_to = support_user
-            self.save()
+            self.save(update_fields=['state', 'assigned_to', 'updated_at'])
             return True
         return False
 
@@ -249,17 +266,17 @@ class ServiceRequest(models.Model):
         """Start working on the request."""
         if self.state == 'assigned':
             self.state = 'in_progress'
-            self.save()
+            self.save(update_fields=['state', 'updated_at'])
             return True
         return False
 
     def complete(self, notes=''):
         """Mark request as completed."""
-        if self.state in ['assigned', 'in_progress', 'needs_help']:
+        if self.state in _COMPLETABLE:
             self.state = 'completed'
             self.fulfillment_notes = notes
             self.completed_at = timezone.now()
-            self.save()
+            self.save(update_fields=['state', 'fulfillment_notes', 'completed_at', 'updated_at'])
             return True
         return False
 
@@ -268,15 +285,42 @@ class ServiceRequest(models.Model):
         if self.state == 'in_progress':
             self.state = 'needs_help'
             self.fulfillment_notes = notes
-            self.save()
+            self.save(update_fields=['state', 'fulfillment_notes', 'updated_at'])
             return True
         return False
 
     def cancel(self):
         """Cancel the request."""
-        if self.state in ['draft', 'awaiting_approval']:
+        if self.state in _CANCELLABLE:
             self.state = 'cancelled'
-            self.save()
+            self.save(update_fields=['state', 'updated_at'])
             return True
         return False
 
+    # Bulk workflow actions: one UPDATE for a whole queryset. Like
+    # QuerySet.update(), these skip save() and the model signals, so no
+    # per-request notifications are sent, and updated_at (auto_now) has to
+    # be set explicitly. Each returns the rows changed.
+    @classmethod
+    def bulk_approve(cls, queryset, approver, notes=''):
+        """
+        Approve every request in queryset still awaiting approval.
+        Existing approval notes are kept unless notes are given.
+        """
+        now = timezone.now()
+        fields = {'state': 'approved', 'approver': approver, 'approved_at': now, 'updated_at': now}
+        if notes:
+            fields['approval_notes'] = notes
+        return queryset.filter(state='awaiting_approval').update(**fields)
+
+    @classmethod
+    def bulk_reject(cls, queryset, approver, notes=''):
+        """
+        Reject every request in queryset still awaiting approval.
+        Existing approval notes are kept unless notes are given.
+        """
+        now = timezone.now()
+        fields = {'state': 'rejected', 'approver': approver, 'rejected_at': now, 'updated_at': now}
+        if notes:
+            fields['approval_notes'] = notes
+        return queryset.filter(state='awaiting_approval').update(**fields)
@@ -31,7 +31,16 @@ class TestServiceRequestModel:
         assert sr.requester == requester
         assert sr.number is not None  # Auto-generated
         assert sr.state == "draft"
-    
+
+    def test_request_numbers_continue_from_existing(self):
+        """Test request numbers follow on from the highest issued one"""
+        requester = User.objects.create_user(username="user", password="test")
+        ServiceRequest.objects.create(title="Old", requester=requester, number="REQ0000041")
+        first = ServiceRequest.objects.create(title="First", requester=requester)
+        second = ServiceRequest.objects.create(title="Second", requester=requester)
+        assert first.number == "REQ0000042"
+        assert second.number == "REQ0000043"
+
     def test_submit_service_request(self):
         """Test submitting a service request"""
         requester = User.objects.create_user(username="user", password="test")
@@ -90,7 +99,44 @@ class TestServiceRequestModel:
         assert sr.state == "approved"
         assert sr.approver == manager
         assert sr.approved_at is not None
-    
+
+    def test_bulk_approve_service_requests(self):
+        """Test approving several requests in one update"""
+        requester = User.objects.create_user(username="user", password="test")
+        manager = User.objects.create_user(username="manager", password="test", role="manager")
+        for _ in range(2):
+            ServiceRequest.objects.create(
+                title="Request",
+                requester=requester,
+                request_type="software",
+                state="awaiting_approval"
+            )
+        draft = ServiceRequest.objects.create(title="Draft", requester=requester)
+        approved = ServiceRequest.bulk_approve(ServiceRequest.objects.all(), manager, "Batch")
+        assert approved == 2
+        assert ServiceRequest.objects.filter(state="approved", approver=manager).count() == 2
+        draft.refresh_from_db()
+        assert draft.state == "draft"
+
+    def test_bulk_reject_keeps_notes_and_touches_updated_at(self):
+        """Test bulk reject without notes keeps existing ones and bumps updated_at"""
+        requester = User.objects.create_user(username="user", password="test")
+        manager = User.objects.create_user(username="manager", password="test", role="manager")
+        sr = ServiceRequest.objects.create(
+            title="Request",
+            requester=requester,
+            request_type="software",
+            state="awaiting_approval",
+            approval_notes="Needs budget sign-off"
+        )
+        before = sr.updated_at
+        rejected = ServiceRequest.bulk_reject(ServiceRequest.objects.all(), manager)
+        assert rejected == 1
+        sr.refresh_from_db()
+        assert sr.state == "rejected"
+        assert sr.approval_notes == "Needs budget sign-off"
+        assert sr.updated_at > before
+
     def test_reject_service_request(self):
         """Test rejecting a service request"""
         requester = User.objects.create_user(username="user", password="test")
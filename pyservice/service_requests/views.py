@@ -3,25 +3,84 @@ Service Request Views
 PyService Mini-ITSM Platform
 """
 
+from functools import wraps
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Case, IntegerField, When
 from .models import ServiceRequest
 from .forms import ServiceRequestForm
 from cmdb.models import User
 
 
+def with_request_lock(view_func):
+    """
+    Login plus the row lock shared by the workflow views.
+    On POST the request row is locked (SELECT ... FOR UPDATE) for the whole
+    view, so the permission check and the transition it guards see the
+    same state and two users cannot both claim or approve one request.
+    """
+    @login_required
+    @wraps(view_func)
+    def wrapper(request, pk):
+        queryset = ServiceRequest.objects.all()
+        if request.method == 'POST':
+            queryset = queryset.select_for_update()
+        with transaction.atomic():
+            request_obj = get_object_or_404(queryset, pk=pk)
+            return view_func(request, request_obj)
+    return wrapper
+
+
+def require_roles(*roles, message='You do not have permission to do that.'):
+    """
+    Only let users with one of roles through; others are sent back to the
+    request list with message. Goes under @with_request_lock, which has
+    already required login.
+    """
+    allowed = frozenset(roles)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.user.role not in allowed:
+                messages.error(request, message)
+                return redirect('request_list')
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 @login_required
 def request_list(request):
     """List all service requests."""
-    requests = ServiceRequest.objects.all()
+    # Open requests first, completed ones at the bottom. Users are joined
+    # in and only the columns the table shows are loaded.
+    requests = ServiceRequest.objects.select_related('requester', 'assigned_to').only(
+        'number', 'title', 'request_type', 'location', 'state', 'created_at',
+        'requester__username', 'assigned_to__username'
+    ).order_by(
+        Case(When(state='completed', then=1), default=0, output_field=IntegerField()),
+        '-created_at'
+    )
+    
+    # Pagination
+    paginator = Paginator(requests, 25)
+    page = request.GET.get('page')
+    requests = paginator.get_page(page)
+    
     return render(request, 'service_requests/request_list.html', {'requests': requests})
 
 
 @login_required
 def request_detail(request, pk):
     """View service request details."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
+    request_obj = get_object_or_404(
+        ServiceRequest.objects.select_related('requester', 'approver', 'assigned_to'), pk=pk
+    )
     return render(request, 'service_requests/request_detail.html', {'request_obj': request_obj})
 
 
@@ -44,13 +103,9 @@ def request_create(request):
         if request.user.role != 'admin':
             form.initial['requester'] = request.user.pk
     
-    users = User.objects.all()
-    it_users = User.objects.filter(role__in=['it_support', 'technician', 'admin'])
     is_admin = request.user.role == 'admin'
     return render(request, 'service_requests/request_form.html', {
         'form': form,
-        'users': users,
-        'it_users': it_users,
         'is_admin': is_admin
     })
 
@@ -68,74 +123,62 @@ def request_update(request, pk):
     else:
         form = ServiceRequestForm(instance=request_obj)
     
-    users = User.objects.all()
-    it_users = User.objects.filter(role__in=['it_support', 'technician', 'admin'])
     return render(request, 'service_requests/request_form.html', {
-        'form': form,
-        'users': users,
-        'it_users': it_users
+        'form': form
     })
 
 
-@login_required
-def request_submit(request, pk):
+@with_request_lock
+def request_submit(request, request_obj):
     """Submit request for approval."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
     if request.method == 'POST':
         if request_obj.submit():
             messages.success(request, 'Request submitted for approval.')
         else:
             messages.error(request, 'Cannot submit request in current state.')
-    return redirect('request_detail', pk=pk)
+    return redirect('request_detail', pk=request_obj.pk)
 
 
-@login_required
-def request_approve(request, pk):
+@with_request_lock
+def request_approve(request, request_obj):
     """Approve a service request."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
     if request.method == 'POST':
         if request_obj.approve(request.user):
             messages.success(request, 'Request approved.')
         else:
             messages.error(request, 'Cannot approve request in current state.')
-    return redirect('request_detail', pk=pk)
+    return redirect('request_detail', pk=request_obj.pk)
 
 
-@login_required
-def request_reject(request, pk):
+@with_request_lock
+def request_reject(request, request_obj):
     """Reject a service request."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
     if request.method == 'POST':
         if request_obj.reject(request.user):
             messages.warning(request, 'Request rejected.')
         else:
             messages.error(request, 'Cannot reject request in current state.')
-    return redirect('request_detail', pk=pk)
+    return redirect('request_detail', pk=request_obj.pk)
 
 
-@login_required
-def request_claim(request, pk):
+@with_request_lock
+@require_roles(*User.SUPPORT_ROLES, message='Only support staff can claim requests.')
+def request_claim(request, request_obj):
     """Support staff claims this request - I'll handle it."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
     if request.method == 'POST':
-        # Only support roles can claim
-        if request.user.role in ['it_support', 'technician', 'admin']:
-            if request_obj.claim(request.user):
-                messages.success(request, f'You are now assigned to this request.')
-            else:
-                messages.error(request, 'Cannot claim this request.')
+        if request_obj.claim(request.user):
+            messages.success(request, 'You are now assigned to this request.')
         else:
-            messages.error(request, 'Only support staff can claim requests.')
+            messages.error(request, 'Cannot claim this request.')
     return redirect('request_list')
 
 
-@login_required
-def request_complete(request, pk):
+@with_request_lock
+def request_complete(request, request_obj):
     """Mark request as completed."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
     if request.method == 'POST':
         # Only assigned user or admin can complete
-        if request.user == request_obj.assigned_to or request.user.role == 'admin':
+        if request.user.pk == request_obj.assigned_to_id or request.user.role == 'admin':
             if request_obj.complete():
                 messages.success(request, 'Request marked as completed!')
             else:
@@ -145,13 +188,12 @@ def request_complete(request, pk):
     return redirect('request_list')
 
 
-@login_required
-def request_escalate(request, pk):
+@with_request_lock
+def request_escalate(request, request_obj):
     """Request needs advanced help."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
     if request.method == 'POST':
         # Only assigned user can escalate
-        if request.user == request_obj.assigned_to or request.user.role == 'admin':
+        if request.user.pk == request_obj.assigned_to_id or request.user.role == 'admin':
             if request_obj.escalate('Needs advanced assistance'):
                 messages.warning(request, 'Request escalated - needs advanced help.')
             else:
@@ -161,16 +203,12 @@ def request_escalate(request, pk):
     return redirect('request_list')
 
 
-@login_required
-def request_delete(request, pk):
+@with_request_lock
+@require_roles('admin', message='Only administrators can delete requests.')
+def request_delete(request, request_obj):
     """Delete a service request - Admin only."""
-    request_obj = get_object_or_404(ServiceRequest, pk=pk)
     if request.method == 'POST':
-        # Only admin can delete
-        if request.user.role == 'admin':
-            request_number = request_obj.number
-            request_obj.delete()
-            messages.success(request, f'Request {request_number} deleted successfully.')
-        else:
-            messages.error(request, 'Only administrators can delete requests.')
+        request_number = request_obj.number
+        request_obj.delete()
+        messages.success(request, f'Request {request_number} deleted successfully.')
     return redirect('request_list')